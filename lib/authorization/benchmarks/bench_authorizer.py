@@ -0,0 +1,308 @@
+"""Offline benchmark for the WebSocket authorizer (websocket-api-authorizer/lambda_function.py).
+
+Nothing here talks to AWS: RSA key pairs are generated with the vendored rsa
+package, the JWKS document is served from a local HTTP stand-in, and tokens
+are minted locally for each scenario (valid, expired, wrong audience, bad
+signature, malformed). The harness measures
+
+- cold start: a fresh interpreter importing lambda_function and serving its
+  first request, repeated --cold-runs times, both without and with a JWKS
+  snapshot left in /tmp by a previous environment
+- warm latency (p50/p99) and throughput of lambda_handler per scenario
+- throughput of the verify_tokens batch API over a mix of all scenarios,
+  in process and with a --processes pool
+
+and writes everything to a JSON file so runs can be compared over time:
+
+    python bench_authorizer.py --iterations 300 --output authorizer-benchmark.json
+    python bench_authorizer.py --compare authorizer-benchmark.json --threshold 0.2
+"""
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import common
+
+common.use_authorizer_path()
+
+import rsa  # noqa: E402
+from jose import jwt  # noqa: E402
+from jose.backends.rsa_backend import RSAKey  # noqa: E402
+
+USER_POOL_ID = 'us-east-1_BENCHMARK'
+APP_CLIENT_ID = 'benchmark-client'
+ISSUER = f'https://cognito-idp.us-east-1.amazonaws.com/{USER_POOL_ID}'
+METHOD_ARN = 'arn:aws:execute-api:us-east-1:123456789012:abcdef1234/prod/$connect'
+KID = 'benchmark-key'
+
+
+def generate_keys(bits):
+    """Signing key for the user pool plus an unrelated key used to forge bad signatures."""
+    _, private = rsa.newkeys(bits)
+    _, forged = rsa.newkeys(bits)
+    signing_key = RSAKey(private, 'RS256')
+    public_jwk = signing_key.public_key().to_dict()
+    public_jwk.update({'kid': KID, 'use': 'sig'})
+    return signing_key, RSAKey(forged, 'RS256'), {'keys': [public_jwk]}
+
+
+class JWKSServer:
+    """Local stand-in for the Cognito JWKS endpoint."""
+
+    def __init__(self, document):
+        body = json.dumps(document).encode('utf-8')
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests += 1
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.requests = 0
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self._httpd.server_address[1]}/{USER_POOL_ID}/.well-known/jwks.json'
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class TokenFactory:
+    def __init__(self, signing_key, forged_key):
+        self.signing_key = signing_key
+        self.forged_key = forged_key
+        self._serial = 0
+
+    def _claims(self, **overrides):
+        self._serial += 1
+        now = int(time.time())
+        claims = {
+            'sub': f'user-{self._serial % 50}',
+            'aud': APP_CLIENT_ID,
+            'iss': ISSUER,
+            'token_use': 'id',
+            'iat': now,
+            'exp': now + 3600,
+            'jti': f'benchmark-{self._serial}',
+            'custom:role': '["BasicUser"]',
+        }
+        claims.update(overrides)
+        return claims
+
+    def _sign(self, claims, key=None):
+        return jwt.encode(claims, key or self.signing_key, algorithm='RS256', headers={'kid': KID})
+
+    def valid(self):
+        return self._sign(self._claims())
+
+    def expired(self):
+        now = int(time.time())
+        return self._sign(self._claims(iat=now - 7200, exp=now - 3600))
+
+    def wrong_audience(self):
+        return self._sign(self._claims(aud='some-other-client'))
+
+    def bad_signature(self):
+        # Well-formed token for a known kid, signed by a key the pool never issued
+        return self._sign(self._claims(), key=self.forged_key)
+
+    def malformed(self):
+        self._serial += 1
+        return f'not-a-jwt-{self._serial}'
+
+
+def authorizer_env(jwks_url, snapshot_path=''):
+    env = dict(os.environ)
+    env.update({
+        'USER_POOL_ID': USER_POOL_ID,
+        'APP_CLIENT_ID': APP_CLIENT_ID,
+        'JWKS_URL': jwks_url,
+        'JWKS_SNAPSHOT_PATH': snapshot_path,
+        # The scenarios replay many tokens per sub; measure verification, not throttling
+        'RATE_LIMIT_PER_SECOND': '0',
+    })
+    return env
+
+
+def event_for(token):
+    return {'queryStringParameters': {'Authorization': token}, 'methodArn': METHOD_ARN}
+
+
+def invoke(handler, token):
+    """Run the handler with its logging discarded; returns True when access was allowed."""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        try:
+            result = handler(event_for(token), None)
+        except Exception:
+            return False
+    if not result:
+        return False
+    return result['policyDocument']['Statement'][0]['Effect'] == 'Allow'
+
+
+# Runs in a fresh interpreter so the timings include every import the Lambda
+# init phase pays for; nothing from this harness is loaded in that process.
+COLD_START_CHILD = """
+import json, os, time
+t0 = time.perf_counter()
+import lambda_function
+t1 = time.perf_counter()
+result = lambda_function.lambda_handler(json.loads(os.environ['BENCHMARK_EVENT']), None)
+t2 = time.perf_counter()
+allowed = bool(result) and result['policyDocument']['Statement'][0]['Effect'] == 'Allow'
+print(json.dumps({'import_ms': (t1 - t0) * 1000, 'first_invoke_ms': (t2 - t1) * 1000, 'allowed': allowed}))
+"""
+
+
+def run_cold_child(env):
+    output = subprocess.run(
+        [sys.executable, '-c', COLD_START_CHILD],
+        cwd=common.AUTHORIZER_DIR, env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure_cold_start(server, token, runs, snapshot_path=''):
+    env = authorizer_env(server.url, snapshot_path)
+    env['BENCHMARK_EVENT'] = json.dumps(event_for(token))
+    if snapshot_path:
+        # One unmeasured start leaves the snapshot behind, as an earlier environment would
+        run_cold_child(env)
+    requests_before = server.requests
+    imports, first_invokes, totals = [], [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        child = run_cold_child(env)
+        totals.append(time.perf_counter() - started)
+        if not child['allowed']:
+            raise RuntimeError('Cold start invocation rejected a valid token')
+        imports.append(child['import_ms'] / 1000)
+        first_invokes.append(child['first_invoke_ms'] / 1000)
+    return {
+        'import': common.summarize(imports),
+        'first_invoke': common.summarize(first_invokes),
+        'process_total': common.summarize(totals),
+        'jwks_requests': server.requests - requests_before,
+    }
+
+
+def measure_warm(handler, scenarios, expected):
+    results = {}
+    for name, tokens in scenarios.items():
+        allowed = 0
+        samples = []
+        started = time.perf_counter()
+        for token in tokens:
+            t0 = time.perf_counter()
+            allowed += invoke(handler, token)
+            samples.append(time.perf_counter() - t0)
+        wall = time.perf_counter() - started
+        summary = common.summarize(samples, wall)
+        summary['allowed'] = allowed
+        if bool(allowed) != expected[name]:
+            raise RuntimeError(f'Scenario {name}: unexpected decisions ({allowed}/{len(tokens)} allowed)')
+        results[name] = summary
+    return results
+
+
+def measure_batch(verify_tokens, tokens, processes=None):
+    started = time.perf_counter()
+    decisions = verify_tokens(tokens, processes=processes)
+    wall = time.perf_counter() - started
+    summary = common.summarize([d['ms'] / 1000 for d in decisions], wall)
+    summary['allowed'] = sum(d['allowed'] for d in decisions)
+    summary['processes'] = processes or 1
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=200, help='invocations per warm scenario')
+    parser.add_argument('--cold-runs', type=int, default=5, help='fresh interpreters to start for cold-start timing')
+    parser.add_argument('--key-bits', type=int, default=2048)
+    parser.add_argument('--processes', type=int, default=os.cpu_count(), help='pool size for the batch_pool measurement')
+    parser.add_argument('--output', default='authorizer-benchmark.json')
+    parser.add_argument('--compare', metavar='BASELINE', help='previous results file to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed p50/p99 growth against --compare')
+    args = parser.parse_args()
+
+    print(f'Generating {args.key_bits}-bit RSA keys...')
+    signing_key, forged_key, document = generate_keys(args.key_bits)
+    factory = TokenFactory(signing_key, forged_key)
+
+    print(f'Minting tokens for {args.iterations} iterations per scenario...')
+    scenarios = {
+        'valid': [factory.valid() for _ in range(args.iterations)],
+        'valid_repeat': [factory.valid()] * args.iterations,
+        'expired': [factory.expired() for _ in range(args.iterations)],
+        'wrong_audience': [factory.wrong_audience() for _ in range(args.iterations)],
+        'bad_signature': [factory.bad_signature() for _ in range(args.iterations)],
+        'bad_signature_repeat': [factory.bad_signature()] * args.iterations,
+        'malformed': [factory.malformed() for _ in range(args.iterations)],
+    }
+    expected = {name: name.startswith('valid') for name in scenarios}
+
+    with JWKSServer(document) as server, tempfile.TemporaryDirectory() as tmp:
+        print(f'Measuring cold start over {args.cold_runs} runs...')
+        token = factory.valid()
+        results = {
+            'cold_start': measure_cold_start(server, token, args.cold_runs),
+            'cold_start_snapshot': measure_cold_start(
+                server, token, args.cold_runs, snapshot_path=os.path.join(tmp, 'jwks-snapshot.json'),
+            ),
+        }
+
+        os.environ.update(authorizer_env(server.url))
+        import lambda_function
+
+        print('Measuring warm invocations...')
+        results.update(measure_warm(lambda_function.lambda_handler, scenarios, expected))
+
+        print('Measuring batch verification...')
+        mixed = [token for tokens in scenarios.values() for token in tokens]
+        results['batch'] = measure_batch(lambda_function.verify_tokens, mixed)
+        results['batch_pool'] = measure_batch(lambda_function.verify_tokens, mixed, args.processes)
+        if results['batch']['allowed'] != results['batch_pool']['allowed']:
+            raise RuntimeError('Batch verification with a process pool reached different decisions')
+        results['jwks_requests'] = server.requests
+
+    for variant in ('cold_start', 'cold_start_snapshot'):
+        print(f"{variant} ({results[variant]['jwks_requests']} JWKS requests):")
+        for phase in ('import', 'first_invoke', 'process_total'):
+            summary = results[variant][phase]
+            print(f"{phase:>16}: p50 {summary['p50_ms']:8.3f}ms  p99 {summary['p99_ms']:8.3f}ms")
+    for name, summary in results.items():
+        if isinstance(summary, dict) and 'p50_ms' in summary:
+            print(f"{name:>16}: p50 {summary['p50_ms']:8.3f}ms  p99 {summary['p99_ms']:8.3f}ms  "
+                  f"{summary['ops_per_sec']:10.1f} ops/s")
+
+    params = {'iterations': args.iterations, 'cold_runs': args.cold_runs, 'key_bits': args.key_bits,
+              'processes': args.processes}
+    common.write_results(args.output, 'authorizer', params, results)
+
+    if args.compare and common.compare(results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Cold-start cost of the ecdsa generator tables, with and without the persisted cache.
+
+The first multiplication by a curve's generator in a process builds a table
+of its doublings (PointJacobi._maybe_precompute). ecdsa.precompute can load
+that table from a cache file instead. Per curve this measures:
+
+- table_compute / table_load: building the table against reading it from the
+  cache file (the file is re-read for every sample), in this process
+- first_sign / first_verify: the first signature made or checked in a fresh
+  interpreter, with the cache disabled, from the bundled ecdsa/precompute.bin
+  and from a copy written to the temp directory
+
+    python bench_ecdsa.py --runs 20 --output ecdsa-benchmark.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import common
+
+common.use_authorizer_path()
+
+from ecdsa import SigningKey, curves, precompute  # noqa: E402
+
+CURVES = ('NIST256p', 'NIST384p', 'NIST521p', 'SECP256k1')
+
+# Runs in a fresh interpreter; imports are not timed, like a Lambda init
+# that has already loaded the authorizer module
+COLD_START = '''
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+from ecdsa import SigningKey, VerifyingKey
+pem, signature = sys.argv[3].encode(), bytes.fromhex(sys.argv[4])
+started = time.perf_counter()
+if sys.argv[2] == 'sign':
+    SigningKey.from_pem(pem).sign(b'benchmark message')
+else:
+    VerifyingKey.from_pem(pem).verify(signature, b'benchmark message')
+print(json.dumps(time.perf_counter() - started))
+'''
+
+
+def cold_start(operation, pem, signature, cache):
+    env = dict(os.environ)
+    if cache is None:
+        env.pop(precompute.CACHE_ENV, None)
+    else:
+        env[precompute.CACHE_ENV] = cache
+    output = subprocess.run(
+        [sys.executable, '-c', COLD_START, common.AUTHORIZER_DIR, operation, pem, signature.hex()],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output)
+
+
+def bench_curve(curve, runs, temp_cache):
+    generator = curve.generator
+    results = {}
+
+    samples, wall = common.timed(generator._compute_precompute, runs)
+    results['table_compute'] = common.summarize(samples, wall)
+
+    def load():
+        precompute.reset()
+        if precompute.load(generator) is None:
+            raise RuntimeError(f'no usable cached table for {curve.name}')
+
+    samples, wall = common.timed(load, runs)
+    results['table_load'] = common.summarize(samples, wall)
+    results['speedup_table'] = results['table_compute']['mean_ms'] / results['table_load']['mean_ms']
+
+    signing_key = SigningKey.generate(curve)
+    signature = signing_key.sign(b'benchmark message')
+    keys = {'sign': signing_key.to_pem().decode(), 'verify': signing_key.verifying_key.to_pem().decode()}
+    caches = (('no_cache', ''), ('bundled', None), ('temp', temp_cache))
+    for operation, pem in keys.items():
+        for name, cache in caches:
+            samples = [cold_start(operation, pem, signature, cache) for _ in range(runs)]
+            results[f'first_{operation}_{name}'] = common.summarize(samples)
+        results[f'speedup_first_{operation}'] = (
+            results[f'first_{operation}_no_cache']['mean_ms'] / results[f'first_{operation}_bundled']['mean_ms'])
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=20, help='samples, and fresh interpreters, per path and curve')
+    parser.add_argument('--curves', nargs='+', choices=CURVES, default=list(CURVES))
+    parser.add_argument('--output', default='ecdsa-benchmark.json')
+    parser.add_argument('--compare', metavar='BASELINE', help='previous results file to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed p50/p99 growth against --compare')
+    args = parser.parse_args()
+
+    if not os.path.exists(precompute.BUNDLED_CACHE):
+        print(f'{precompute.BUNDLED_CACHE} is missing, bundled results measure the fallback')
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        temp_cache = precompute.save(os.path.join(directory, 'ecdsa-precompute.bin'))
+        for name in args.curves:
+            for path, value in bench_curve(getattr(curves, name), args.runs, temp_cache).items():
+                results[f'{name}_{path}'] = value
+
+    for name, value in results.items():
+        if isinstance(value, dict):
+            print(f"{name:>36}: p50 {value['p50_ms']:8.3f}ms  p99 {value['p99_ms']:8.3f}ms")
+        else:
+            print(f'{name:>36}: {value:.2f}x')
+
+    params = {'runs': args.runs, 'curves': args.curves}
+    common.write_results(args.output, 'ecdsa', params, results)
+
+    if args.compare and common.compare(results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
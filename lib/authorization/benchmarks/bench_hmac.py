@@ -0,0 +1,93 @@
+"""Micro-benchmark for HS256/384/512 signatures in the vendored jose native backend.
+
+Compares three ways of checking the MAC of a service token's signing input:
+
+- rekey: hmac.new(key, msg, hash) for every call, as HMACKey used to
+- keyed: HMACKey.verify, which copies an hmac object keyed once
+- verify_many: HMACKey.verify_many over the whole batch
+
+    python bench_hmac.py --iterations 5000 --rounds 20 --output hmac-benchmark.json
+"""
+import argparse
+import hashlib
+import hmac
+import os
+import sys
+
+import common
+
+common.use_authorizer_path()
+
+from jose.backends.native import HMACKey  # noqa: E402
+from jose.constants import ALGORITHMS  # noqa: E402
+
+
+def signing_inputs(count, size):
+    # Distinct messages of a typical header.payload length
+    return [os.urandom(size // 2).hex().encode('ascii')[:size] for _ in range(count)]
+
+
+def bench_algorithm(algorithm, secret, messages, rounds):
+    key = HMACKey(secret, algorithm)
+    hash_alg = HMACKey.HASHES[algorithm]
+    items = [(msg, key.sign(msg)) for msg in messages]
+
+    def rekey():
+        for msg, sig in items:
+            hmac.compare_digest(sig, hmac.new(secret, msg, hash_alg).digest())
+
+    def keyed():
+        for msg, sig in items:
+            key.verify(msg, sig)
+
+    def many():
+        if not all(key.verify_many(items)):
+            raise RuntimeError('verify_many rejected a valid signature')
+
+    results = {}
+    for name, fn in (('rekey', rekey), ('keyed', keyed), ('verify_many', many)):
+        # One sample per round: the round's wall time spread over its tokens
+        samples, wall = common.timed(fn, rounds)
+        summary = common.summarize([sample / len(items) for sample in samples])
+        summary['ops_per_sec'] = rounds * len(items) / wall
+        results[name] = summary
+    results['speedup_keyed'] = results['rekey']['mean_ms'] / results['keyed']['mean_ms']
+    results['speedup_verify_many'] = results['rekey']['mean_ms'] / results['verify_many']['mean_ms']
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=5000, help='tokens verified per round')
+    parser.add_argument('--rounds', type=int, default=20, help='rounds per path and algorithm')
+    parser.add_argument('--message-bytes', type=int, default=400, help='length of each signing input')
+    parser.add_argument('--output', default='hmac-benchmark.json')
+    parser.add_argument('--compare', metavar='BASELINE', help='previous results file to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed p50/p99 growth against --compare')
+    args = parser.parse_args()
+
+    secret = hashlib.sha256(b'benchmark service secret').hexdigest().encode('ascii')
+    messages = signing_inputs(args.iterations, args.message_bytes)
+
+    results = {}
+    for algorithm in sorted(ALGORITHMS.HMAC):
+        for path, summary in bench_algorithm(algorithm, secret, messages, args.rounds).items():
+            results[f'{algorithm}_{path}'] = summary
+
+    for algorithm in sorted(ALGORITHMS.HMAC):
+        for path in ('rekey', 'keyed', 'verify_many'):
+            summary = results[f'{algorithm}_{path}']
+            print(f"{algorithm} {path:>11}: {summary['mean_ms'] * 1000:7.3f}us/token  {summary['ops_per_sec']:11.1f} ops/s")
+        print(f"{algorithm} speedup: keyed {results[f'{algorithm}_speedup_keyed']:.2f}x, "
+              f"verify_many {results[f'{algorithm}_speedup_verify_many']:.2f}x")
+
+    params = {'iterations': args.iterations, 'rounds': args.rounds, 'message_bytes': args.message_bytes}
+    common.write_results(args.output, 'hmac', params, results)
+
+    if args.compare and common.compare(results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""Benchmarks for the vendored pure-Python rsa package used to mint and check test tokens.
+
+- sign: PKCS#1 v1.5 SHA-256 signing through rsa.pkcs1.sign (CRT private-key
+  operation) against a reference that exponentiates with the full private
+  exponent d. Every signature from the two paths is compared byte for byte
+  before anything is timed, so a run doubles as a test-vector check.
+- blinding: blind() and pkcs1.sign with the per-operation blinding factor
+  update against a precomputed BlindingPool (refilled inline or on a
+  background thread), plus --threads concurrent signers sharing one key.
+- verify: rsa.pkcs1.verify against a Verifier bound to the key, one call at
+  a time and through Verifier.verify_many; decisions must agree.
+- keygen: prime search with the small-prime sieve in rsa.prime.is_prime
+  against plain Miller-Rabin, and rsa.newkeys in one process against
+  --poolsize workers from the persistent rsa.parallel pool (started once,
+  before timing). Runs --keygen-runs keys per path; the section ignores
+  the generated benchmark key.
+- files: hashing a --file-mb file in 1 KB reads (compute_hash before
+  streaming) against compute_hash's readinto loop and the memory-mapped
+  compute_file_hash, then sign_file/verify_file end to end. Digests must
+  agree.
+
+Keys are generated fresh for each --key-bits size (4096-bit generation takes
+a while in pure Python):
+
+    python bench_rsa.py --key-bits 2048 4096 --iterations 50 --output rsa-benchmark.json
+"""
+import argparse
+import copy
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import common
+
+common.use_authorizer_path()
+
+import rsa  # noqa: E402
+from rsa import common as rsa_common, core, parallel, pkcs1, prime, randnum, transform  # noqa: E402
+
+HASH_METHOD = 'SHA-256'
+
+
+def sign_full_exponent(message, priv_key, hash_method=HASH_METHOD):
+    """pkcs1.sign with one exponentiation by d modulo n, as the key did before CRT."""
+    cleartext = pkcs1.HASH_ASN1[hash_method] + pkcs1.compute_hash(message, hash_method)
+    keylength = rsa_common.byte_size(priv_key.n)
+    payload = transform.bytes2int(pkcs1._pad_for_signing(cleartext, keylength))
+    blinded, blindfac_inverse = priv_key.blind(payload)
+    encrypted = priv_key.unblind(core.encrypt_int(blinded, priv_key.d, priv_key.n), blindfac_inverse)
+    return transform.int2bytes(encrypted, keylength)
+
+
+def check_sign_vectors(priv_key, pub_key, messages):
+    for message in messages:
+        expected = sign_full_exponent(message, priv_key)
+        signature = pkcs1.sign(message, priv_key, HASH_METHOD)
+        if signature != expected:
+            raise RuntimeError(f'CRT signature differs from the full-exponent one for a {len(message)}-byte message')
+        pkcs1.verify(message, signature, pub_key)
+    return len(messages)
+
+
+def bench_sign(priv_key, pub_key, messages, args):
+    iterations = args.iterations
+    vectors = check_sign_vectors(priv_key, pub_key, messages)
+    results = {'vectors_checked': vectors}
+    paths = (
+        ('full_exponent', lambda m: sign_full_exponent(m, priv_key)),
+        ('crt', lambda m: pkcs1.sign(m, priv_key, HASH_METHOD)),
+    )
+    for name, sign in paths:
+        queue = iter(messages * (iterations // len(messages) + 1))
+        samples, wall = common.timed(lambda: sign(next(queue)), iterations)
+        results[name] = common.summarize(samples, wall)
+    results['speedup'] = results['full_exponent']['mean_ms'] / results['crt']['mean_ms']
+    return results
+
+
+def concurrent_signing(priv_key, messages, threads, per_thread):
+    """Wall time for `threads` signers sharing one key, as a summary per signature."""
+    def worker():
+        for i in range(per_thread):
+            pkcs1.sign(messages[i % len(messages)], priv_key, HASH_METHOD)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker_thread in workers:
+        worker_thread.start()
+    for worker_thread in workers:
+        worker_thread.join()
+    wall = time.perf_counter() - started
+    return common.summarize([wall / (threads * per_thread)] * (threads * per_thread), wall)
+
+
+def bench_blinding(priv_key, pub_key, messages, args):
+    iterations, threads = args.iterations, args.threads
+    payload = transform.bytes2int(messages[0][:64])
+    results = {}
+    for name, pool in (('per_operation', None), ('pool', False), ('pool_background', True)):
+        # A copy per variant so each starts from its own blinding state
+        key = copy.copy(priv_key)
+        if pool is not None:
+            key.use_blinding_pool(size=max(64, iterations), background=pool)
+        samples, wall = common.timed(lambda: key.blind(payload), iterations)
+        results[f'blind_{name}'] = common.summarize(samples, wall)
+        queue = iter(messages * (iterations // len(messages) + 1))
+        samples, wall = common.timed(lambda: pkcs1.sign(next(queue), key, HASH_METHOD), iterations)
+        results[f'sign_{name}'] = common.summarize(samples, wall)
+        results[f'threads_{name}'] = concurrent_signing(key, messages, threads, max(1, iterations // threads))
+        if pool is not None:
+            key.blinding_pool.close()
+    return results
+
+
+def bench_verify(priv_key, pub_key, messages, args):
+    iterations = args.iterations
+    signatures = [pkcs1.sign(message, priv_key, HASH_METHOD) for message in messages]
+    # Every other pair is mismatched so both outcomes are timed
+    pairs = [(message, signatures[(i + i % 2) % len(messages)]) for i, message in enumerate(messages)]
+    expected = [i % 2 == 0 for i in range(len(pairs))]
+
+    def verify_function(message, signature):
+        try:
+            pkcs1.verify(message, signature, pub_key)
+            return True
+        except pkcs1.VerificationError:
+            return False
+
+    verifier = pkcs1.Verifier(pub_key, [HASH_METHOD])
+    decisions = [verify_function(m, s) for m, s in pairs]
+    if decisions != expected or verifier.verify_many(*zip(*pairs)) != expected:
+        raise RuntimeError('Verifier decisions differ from rsa.pkcs1.verify')
+
+    def verify_object(message, signature):
+        try:
+            verifier.verify(message, signature)
+            return True
+        except pkcs1.VerificationError:
+            return False
+
+    results = {}
+    for name, verify in (('function', verify_function), ('verifier', verify_object)):
+        queue = iter(pairs * (iterations // len(pairs) + 1))
+        samples, wall = common.timed(lambda: verify(*next(queue)), iterations)
+        results[name] = common.summarize(samples, wall)
+
+    batch = (pairs * (iterations // len(pairs) + 1))[:iterations]
+    batch_messages, batch_signatures = [m for m, _ in batch], [s for _, s in batch]
+    samples, wall = common.timed(lambda: verifier.verify_many(batch_messages, batch_signatures), 1)
+    results['verify_many'] = common.summarize([wall / len(batch)] * len(batch), wall)
+    results['speedup'] = results['function']['mean_ms'] / results['verifier']['mean_ms']
+    return results
+
+
+def is_prime_without_sieve(number):
+    """rsa.prime.is_prime as it was before the small-prime sieve: only even numbers are skipped."""
+    if number < 10:
+        return number in {2, 3, 5, 7}
+    if not (number & 1):
+        return False
+    return prime.miller_rabin_primality_testing(number, prime.get_primality_testing_rounds(number) + 1)
+
+
+def find_prime(nbits, is_prime):
+    while True:
+        integer = randnum.read_random_odd_int(nbits)
+        if is_prime(integer):
+            return integer
+
+
+def bench_keygen(priv_key, pub_key, messages, args):
+    bits, runs = rsa_common.bit_size(priv_key.n), args.keygen_runs
+    results = {}
+    for name, is_prime in (('prime_miller_rabin', is_prime_without_sieve), ('prime_sieve', prime.is_prime)):
+        samples, wall = common.timed(lambda: find_prime(bits // 2, is_prime), runs)
+        results[name] = common.summarize(samples, wall)
+    results['speedup_prime'] = results['prime_miller_rabin']['mean_ms'] / results['prime_sieve']['mean_ms']
+
+    samples, wall = common.timed(lambda: rsa.newkeys(bits), runs)
+    results['newkeys_single'] = common.summarize(samples, wall)
+    if args.poolsize > 1:
+        parallel.get_pool(args.poolsize)
+        samples, wall = common.timed(lambda: rsa.newkeys(bits, poolsize=args.poolsize), runs)
+        results['newkeys_pool'] = common.summarize(samples, wall)
+        results['speedup_pool'] = results['newkeys_single']['mean_ms'] / results['newkeys_pool']['mean_ms']
+    return results
+
+
+def hash_in_small_blocks(filename, hash_method=HASH_METHOD):
+    """compute_hash on an open file as it was before: 1 KB read() calls."""
+    hasher = pkcs1.HASH_METHODS[hash_method]()
+    with open(filename, 'rb') as infile:
+        for block in pkcs1.yield_fixedblocks(infile, 1024):
+            hasher.update(block)
+    return hasher.digest()
+
+
+def hash_with_readinto(filename, hash_method=HASH_METHOD):
+    with open(filename, 'rb') as infile:
+        return pkcs1.compute_hash(infile, hash_method)
+
+
+def bench_files(priv_key, pub_key, messages, args):
+    runs = args.file_runs
+    with tempfile.NamedTemporaryFile(suffix='.bin') as artifact:
+        chunk = os.urandom(1024 * 1024)
+        for _ in range(args.file_mb):
+            artifact.write(chunk)
+        artifact.flush()
+        filename = artifact.name
+
+        digests = {
+            'blocks_1k': hash_in_small_blocks(filename),
+            'readinto': hash_with_readinto(filename),
+            'mmap': pkcs1.compute_file_hash(filename, HASH_METHOD),
+        }
+        expected = hashlib.new(HASH_METHOD.replace('-', '').lower(), chunk * args.file_mb).digest()
+        if any(digest != expected for digest in digests.values()):
+            raise RuntimeError('file digests differ between hashing paths')
+
+        results = {}
+        paths = (
+            ('blocks_1k', lambda: hash_in_small_blocks(filename)),
+            ('readinto', lambda: hash_with_readinto(filename)),
+            ('mmap', lambda: pkcs1.compute_file_hash(filename, HASH_METHOD)),
+        )
+        for name, fn in paths:
+            samples, wall = common.timed(fn, runs)
+            results[f'hash_{name}'] = common.summarize(samples, wall)
+            results[f'hash_{name}']['mb_per_sec'] = args.file_mb * runs / wall
+        results['speedup_readinto'] = results['hash_blocks_1k']['mean_ms'] / results['hash_readinto']['mean_ms']
+        results['speedup_mmap'] = results['hash_blocks_1k']['mean_ms'] / results['hash_mmap']['mean_ms']
+
+        signature = pkcs1.sign_file(filename, priv_key, HASH_METHOD)
+        samples, wall = common.timed(lambda: pkcs1.sign_file(filename, priv_key, HASH_METHOD), runs)
+        results['sign_file'] = common.summarize(samples, wall)
+        samples, wall = common.timed(lambda: pkcs1.verify_file(filename, signature, pub_key), runs)
+        results['verify_file'] = common.summarize(samples, wall)
+    return results
+
+
+SECTIONS = {
+    'sign': bench_sign,
+    'blinding': bench_blinding,
+    'verify': bench_verify,
+    'keygen': bench_keygen,
+    'files': bench_files,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--key-bits', type=int, nargs='+', default=[2048, 4096])
+    parser.add_argument('--iterations', type=int, default=50, help='timed operations per path and key size')
+    parser.add_argument('--vectors', type=int, default=20, help='distinct messages checked and cycled through')
+    parser.add_argument('--threads', type=int, default=4, help='concurrent signers in the blinding section')
+    parser.add_argument('--keygen-runs', type=int, default=5, help='primes and keys generated per path in keygen')
+    parser.add_argument('--poolsize', type=int, default=os.cpu_count() or 1, help='prime-search processes in keygen')
+    parser.add_argument('--file-mb', type=int, default=64, help='size of the file hashed and signed in files')
+    parser.add_argument('--file-runs', type=int, default=5, help='passes over the file per path in files')
+    parser.add_argument('--sections', nargs='+', choices=sorted(SECTIONS), default=sorted(SECTIONS))
+    parser.add_argument('--output', default='rsa-benchmark.json')
+    parser.add_argument('--compare', metavar='BASELINE', help='previous results file to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed p50/p99 growth against --compare')
+    args = parser.parse_args()
+
+    # Token-sized messages of varying length
+    messages = [os.urandom(200 + 37 * i) for i in range(args.vectors)]
+
+    results = {}
+    for bits in args.key_bits:
+        print(f'Generating a {bits}-bit key...')
+        started = time.perf_counter()
+        pub_key, priv_key = rsa.newkeys(bits)
+        print(f'  took {time.perf_counter() - started:.1f}s')
+        for section in args.sections:
+            section_results = SECTIONS[section](priv_key, pub_key, messages, args)
+            for name, value in section_results.items():
+                results[f'{section}_{bits}_{name}'] = value
+
+    for name, value in results.items():
+        if isinstance(value, dict):
+            print(f"{name:>28}: p50 {value['p50_ms']:9.3f}ms  p99 {value['p99_ms']:9.3f}ms  "
+                  f"{value['ops_per_sec']:9.1f} ops/s")
+        elif isinstance(value, float):
+            print(f'{name:>28}: {value:.2f}x')
+        else:
+            print(f'{name:>28}: {value}')
+
+    params = {'key_bits': args.key_bits, 'iterations': args.iterations, 'vectors': args.vectors,
+              'threads': args.threads, 'keygen_runs': args.keygen_runs, 'poolsize': args.poolsize,
+              'file_mb': args.file_mb, 'file_runs': args.file_runs, 'sections': args.sections}
+    common.write_results(args.output, 'rsa', params, results)
+
+    if args.compare and common.compare(results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""Shared helpers for the authorizer benchmarks.
+
+The benchmarks run against the code in ../websocket-api-authorizer, exactly as
+it is bundled into the Lambda, so the vendored jose/rsa/ecdsa packages are
+the ones being measured.
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+AUTHORIZER_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'websocket-api-authorizer'))
+
+
+def use_authorizer_path():
+    if AUTHORIZER_DIR not in sys.path:
+        sys.path.insert(0, AUTHORIZER_DIR)
+
+
+def percentile(sorted_samples, q):
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, max(0, int(round(q / 100.0 * (len(sorted_samples) - 1)))))
+    return sorted_samples[index]
+
+
+def summarize(samples, total_seconds=None):
+    """Summarise a list of per-call durations (in seconds) as milliseconds."""
+    ordered = sorted(samples)
+    total = total_seconds if total_seconds is not None else sum(ordered)
+    return {
+        'count': len(ordered),
+        'mean_ms': (sum(ordered) / len(ordered)) * 1000 if ordered else 0.0,
+        'min_ms': ordered[0] * 1000 if ordered else 0.0,
+        'p50_ms': percentile(ordered, 50) * 1000,
+        'p90_ms': percentile(ordered, 90) * 1000,
+        'p99_ms': percentile(ordered, 99) * 1000,
+        'max_ms': ordered[-1] * 1000 if ordered else 0.0,
+        'ops_per_sec': len(ordered) / total if total else 0.0,
+    }
+
+
+def timed(fn, iterations):
+    """Call `fn` `iterations` times and return (per-call samples, wall time)."""
+    samples = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples, time.perf_counter() - started
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=AUTHORIZER_DIR, capture_output=True, text=True, timeout=5,
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def write_results(path, benchmark, params, results):
+    document = {
+        'benchmark': benchmark,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': params,
+        'results': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+    print(f'Results written to {path}')
+    return document
+
+
+def compare(results, baseline_path, threshold):
+    """Report scenarios whose p50/p99 grew by more than `threshold` against a baseline file.
+
+    Returns the list of regressions so callers can turn them into an exit code.
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)['results']
+
+    regressions = []
+    for scenario, current in results.items():
+        previous = baseline.get(scenario)
+        if not isinstance(current, dict) or not isinstance(previous, dict):
+            continue
+        for metric in ('p50_ms', 'p99_ms'):
+            if metric not in current or not previous.get(metric):
+                continue
+            change = (current[metric] - previous[metric]) / previous[metric]
+            if change > threshold:
+                regressions.append((scenario, metric, previous[metric], current[metric], change))
+
+    for scenario, metric, before, after, change in regressions:
+        print(f'REGRESSION {scenario} {metric}: {before:.3f}ms -> {after:.3f}ms (+{change:.0%})')
+    if not regressions:
+        print(f'No regressions above {threshold:.0%} against {baseline_path}')
+    return regressions
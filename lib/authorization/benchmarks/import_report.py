@@ -0,0 +1,99 @@
+"""Import-time report for the authorizer's cold start.
+
+Runs a fresh interpreter with ``-X importtime`` that imports lambda_function
+(the same work the Lambda init phase does) and lists which modules and which
+top-level packages cost how many milliseconds:
+
+    python import_report.py
+    python import_report.py --top 40 --output import-report.json
+
+The same report can be built from a real Lambda init: set the function's
+PYTHONPROFILEIMPORTTIME=1 environment variable, copy the ``import time:``
+lines from its CloudWatch log stream and pass them with --from-log.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+import common
+
+LINE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)')
+
+
+def parse(lines):
+    """Parse ``-X importtime`` output into (module, self_us, cumulative_us) tuples."""
+    modules = []
+    for line in lines:
+        match = LINE.search(line)
+        if match:
+            self_us, cumulative_us, name = match.groups()
+            modules.append((name, int(self_us), int(cumulative_us)))
+    return modules
+
+
+def collect(module='lambda_function'):
+    env = dict(os.environ)
+    env.setdefault('USER_POOL_ID', 'us-east-1_IMPORTREPORT')
+    # Time the imports only, not the init-phase JWKS fetch
+    env.setdefault('JWKS_PREFETCH_ON_INIT', 'false')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=common.AUTHORIZER_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'Importing {module} failed:\n{result.stderr}')
+    return parse(result.stderr.splitlines())
+
+
+def report(modules, top):
+    packages = {}
+    for name, self_us, _ in modules:
+        package = name.split('.')[0]
+        packages[package] = packages.get(package, 0) + self_us
+
+    total_us = sum(self_us for _, self_us, _ in modules)
+    return {
+        'total_ms': total_us / 1000,
+        'module_count': len(modules),
+        'packages': [
+            {'package': package, 'self_ms': us / 1000}
+            for package, us in sorted(packages.items(), key=lambda item: -item[1])
+        ],
+        'modules': [
+            {'module': name, 'self_ms': self_us / 1000, 'cumulative_ms': cumulative_us / 1000}
+            for name, self_us, cumulative_us in sorted(modules, key=lambda m: -m[1])[:top]
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--module', default='lambda_function')
+    parser.add_argument('--from-log', metavar='FILE', help="parse 'import time:' lines from a log file instead")
+    parser.add_argument('--top', type=int, default=25, help='number of individual modules to list')
+    parser.add_argument('--output', help='also write the report as JSON')
+    args = parser.parse_args()
+
+    if args.from_log:
+        with open(args.from_log) as f:
+            modules = parse(f)
+    else:
+        modules = collect(args.module)
+    result = report(modules, args.top)
+
+    print(f"{result['module_count']} modules imported in {result['total_ms']:.1f}ms\n")
+    print('By top-level package:')
+    for entry in result['packages'][:args.top]:
+        print(f"  {entry['self_ms']:9.2f}ms  {entry['package']}")
+    print('\nSlowest modules (self time):')
+    for entry in result['modules']:
+        print(f"  {entry['self_ms']:9.2f}ms  {entry['module']}  (cumulative {entry['cumulative_ms']:.2f}ms)")
+
+    if args.output:
+        common.write_results(args.output, 'import_report', {'module': args.module, 'from_log': args.from_log}, result)
+
+
+if __name__ == '__main__':
+    main()
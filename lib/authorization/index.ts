@@ -77,7 +77,10 @@ export class AuthorizationStack extends Construct {
       handler: 'lambda_function.lambda_handler', // Points to the 'hello' file in the lambda directory
       environment: {
         "USER_POOL_ID" : userPool.userPoolId,
-        "APP_CLIENT_ID" : userPoolClient.userPoolClientId
+        "APP_CLIENT_ID" : userPoolClient.userPoolClientId,
+        // Per-principal connection limit, see lambda_function.py
+        "RATE_LIMIT_PER_SECOND" : "1",
+        "RATE_LIMIT_BURST" : "10"
       },
       timeout: cdk.Duration.seconds(30)
     });
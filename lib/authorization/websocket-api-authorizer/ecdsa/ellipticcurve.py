@@ -51,6 +51,7 @@ from six import python_2_unicode_compatible
 from . import numbertheory
 from ._compat import normalise_bytes, int_to_bytes, bit_length, bytes_to_int
 from .errors import MalformedPointError
+from .precompute import load as load_precomputed_table
 from .util import orderlen, string_to_number, number_to_string
 
 
@@ -598,6 +599,15 @@ class PointJacobi(AbstractPoint):
         # self.__precompute to filled one and just ignore the unlikely
         # situation when two threads execute it at the same time (as it won't
         # lead to inconsistent __precompute)
+        table = load_precomputed_table(self)
+        if table is None:
+            table = self._compute_precompute()
+        elif GMPY:  # pragma: no branch
+            table = [(mpz(x), mpz(y)) for x, y in table]
+        self.__precompute = table
+
+    def _compute_precompute(self):
+        """Return the table of doublings of the point used by multiplication."""
         order = self.__order
         assert order
         precompute = []
@@ -613,7 +623,7 @@ class PointJacobi(AbstractPoint):
             doubler = doubler.double().scale()
             precompute.append((doubler.x(), doubler.y()))
 
-        self.__precompute = precompute
+        return precompute
 
     def __getstate__(self):
         # while this code can execute at the same time as _maybe_precompute()
@@ -0,0 +1,226 @@
+"""
+Persisted precomputation tables for curve generators.
+
+Multiplying a generator (key generation, signing, half of every
+verification) uses a table of its doublings that
+:py:meth:`~ecdsa.ellipticcurve.PointJacobi._maybe_precompute` builds on first
+use, which takes tens of milliseconds per curve in every new process. This
+module saves those tables to a binary cache file and loads them back instead.
+
+Tables are only loaded for the generators listed in :data:`KNOWN_TABLES`,
+and only when the SHA-256 of the stored entry matches the one recorded
+there. A cache file that is truncated, corrupted, from another version or
+replaced by someone else (``/tmp`` is shared) is ignored and the table is
+computed as before.
+
+Cache files are searched in :func:`cache_paths` order: the paths in the
+``ECDSA_PRECOMPUTE_CACHE`` environment variable, separated by
+:data:`os.pathsep` (an empty value disables the cache), or by default
+:data:`BUNDLED_CACHE` next to this module and then :data:`TEMP_CACHE`.
+Write one with :func:`save`, for example
+``python -c "from ecdsa.precompute import save; save('ecdsa/precompute.bin')"``
+to update the bundled file.
+
+File format, all integers big-endian::
+
+    header: b"ECPC", version (1 byte), number of entries (2 bytes)
+    entry:  SHA-256 of the generator (32 bytes, see generator_digest),
+            coordinate length in bytes (2 bytes), number of points (4 bytes),
+            then x and y of every point, each coordinate length bytes
+"""
+
+import binascii
+import hashlib
+import os
+import struct
+import tempfile
+
+from ._compat import bit_length, bytes_to_int, int_to_bytes
+
+MAGIC = b"ECPC"
+VERSION = 1
+_HEADER = struct.Struct(">4sBH")
+_ENTRY = struct.Struct(">32sHI")
+
+CACHE_ENV = "ECDSA_PRECOMPUTE_CACHE"
+BUNDLED_CACHE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "precompute.bin"
+)
+TEMP_CACHE = os.path.join(tempfile.gettempdir(), "ecdsa-precompute.bin")
+
+# generator_digest() -> SHA-256 of the entry (header and points) for the
+# generators whose tables may be loaded from a cache file
+KNOWN_TABLES = {
+    # NIST P-256
+    "9dfe2e79666f84f931c971d3070266efe6d47f562de80feb90734d2b65ecf6e2": (
+        "bb7ff50724b26d8257686db72e4d03e21e312c0173a62134379e5c57cdc2ca4c"
+    ),
+    # NIST P-384
+    "c228be9b10987b804cc7807af0327b2d5c643a8158f5ae081293b3e3ab0c3f1a": (
+        "9f67166c5f12621b5af224ef7e7380a2883f77b0e146429971f8c8e458471951"
+    ),
+    # NIST P-521
+    "ca568c42a4a235fd8a3090f2732c59ab1dd4e38dd82b745c51e70ff233fa41cb": (
+        "f06cd612b7d9f879d4acbd307939143f1f6a77a835afd289792ab29ac721658d"
+    ),
+    # secp256k1
+    "42616fff1ea094f2b17e19726c7b4e69e670c8af1f923364133ac4b3aff7ad06": (
+        "f45718a5fcdb4724a4d3c64b880655f3f2650f6ef467a3b291f2b70d013e108d"
+    ),
+}
+
+# path -> entries of that cache file, filled as the paths are first needed
+_files = {}
+
+
+def generator_digest(generator):
+    """
+    Return the SHA-256 identifying a generator: its curve, point and order.
+
+    :param generator: the generator point
+    :type generator: ~ecdsa.ellipticcurve.PointJacobi
+    :rtype: bytes
+    """
+    curve = generator.curve()
+    params = (
+        curve.p(),
+        curve.a(),
+        curve.b(),
+        generator.x(),
+        generator.y(),
+        generator.order(),
+    )
+    return hashlib.sha256(
+        ",".join("%x" % int(i) for i in params).encode("ascii")
+    ).digest()
+
+
+def cache_paths():
+    """Return the cache files to look for tables in, in order."""
+    value = os.environ.get(CACHE_ENV)
+    if value is None:
+        return [BUNDLED_CACHE, TEMP_CACHE]
+    return [path for path in value.split(os.pathsep) if path]
+
+
+def reset():
+    """Forget the cache files read so far, they are read again when needed."""
+    _files.clear()
+
+
+def _read(path):
+    """Return the entries of a cache file by generator digest, {} if unusable."""
+    try:
+        with open(path, "rb") as cache_file:
+            data = cache_file.read()
+    except (IOError, OSError):
+        return {}
+
+    entries = {}
+    try:
+        magic, version, count = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            return {}
+        offset = _HEADER.size
+        for _ in range(count):
+            digest, length, points = _ENTRY.unpack_from(data, offset)
+            end = offset + _ENTRY.size + 2 * length * points
+            if end > len(data):
+                return {}
+            entries[digest] = (length, points, data[offset:end])
+            offset = end
+    except struct.error:
+        return {}
+    return entries
+
+
+def load(generator):
+    """
+    Return the precomputed table of a generator from the cache files.
+
+    :param generator: the generator point
+    :type generator: ~ecdsa.ellipticcurve.PointJacobi
+
+    :return: list of (x, y) tuples, as built by ``_maybe_precompute()``, or
+        None if no cache file has a table matching :data:`KNOWN_TABLES`
+    """
+    digest = generator_digest(generator)
+    expected = KNOWN_TABLES.get(binascii.hexlify(digest).decode("ascii"))
+    if not expected:
+        return None
+
+    for path in cache_paths():
+        entries = _files.get(path)
+        if entries is None:
+            entries = _files[path] = _read(path)
+        if digest not in entries:
+            continue
+        length, points, entry = entries[digest]
+        if hashlib.sha256(entry).hexdigest() != expected:
+            continue
+        table = []
+        start = _ENTRY.size
+        for offset in range(start, start + 2 * length * points, 2 * length):
+            table.append(
+                (
+                    bytes_to_int(entry[offset : offset + length], "big"),
+                    bytes_to_int(
+                        entry[offset + length : offset + 2 * length], "big"
+                    ),
+                )
+            )
+        return table
+    return None
+
+
+def _encode(generator):
+    """Return the cache file entry for a generator, computing its table."""
+    table = generator._compute_precompute()
+    length = (bit_length(generator.curve().p()) + 7) // 8
+    parts = [_ENTRY.pack(generator_digest(generator), length, len(table))]
+    for x, y in table:
+        parts.append(bytes(int_to_bytes(x, length)))
+        parts.append(bytes(int_to_bytes(y, length)))
+    return b"".join(parts)
+
+
+def default_generators():
+    """Return the generators of NIST P-256, P-384, P-521 and secp256k1."""
+    from .curves import NIST256p, NIST384p, NIST521p, SECP256k1
+
+    return [
+        curve.generator for curve in (NIST256p, NIST384p, NIST521p, SECP256k1)
+    ]
+
+
+def save(path=TEMP_CACHE, generators=None):
+    """
+    Compute the tables of generators and write them to a cache file.
+
+    The file is written next to ``path`` and renamed over it, so processes
+    reading it at the same time see either the old or the new file.
+
+    :param str path: the cache file to write
+    :param generators: the generator points to save, by default
+        :func:`default_generators`
+    :return: the path written
+    """
+    if generators is None:
+        generators = default_generators()
+    entries = [_encode(generator) for generator in generators]
+
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, tmp_path = tempfile.mkstemp(dir=directory, prefix=".precompute-")
+    try:
+        with os.fdopen(handle, "wb") as cache_file:
+            cache_file.write(_HEADER.pack(MAGIC, VERSION, len(entries)))
+            for entry in entries:
+                cache_file.write(entry)
+        # mkstemp() makes the file private, other users need to read it
+        os.chmod(tmp_path, 0o644)
+        getattr(os, "replace", os.rename)(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    _files.clear()
+    return path
@@ -0,0 +1,139 @@
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+import os
+import shutil
+import tempfile
+
+from . import precompute
+from .curves import NIST256p, NIST384p, NIST521p, SECP256k1
+from .ecdsa import generator_brainpoolp160r1
+from .ellipticcurve import PointJacobi
+
+
+def fresh_generator(generator):
+    """Return a copy of a generator without its table."""
+    return PointJacobi(
+        generator.curve(),
+        generator.x(),
+        generator.y(),
+        1,
+        generator.order(),
+        generator=True,
+    )
+
+
+class TestPrecomputeCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.directory, "precompute.bin")
+        precompute.save(cls.path)
+        with open(cls.path, "rb") as cache_file:
+            cls.data = cache_file.read()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.directory)
+
+    def setUp(self):
+        self.old_env = os.environ.get(precompute.CACHE_ENV)
+        os.environ[precompute.CACHE_ENV] = self.path
+        precompute.reset()
+
+    def tearDown(self):
+        if self.old_env is None:
+            del os.environ[precompute.CACHE_ENV]
+        else:
+            os.environ[precompute.CACHE_ENV] = self.old_env
+        precompute.reset()
+
+    def write(self, data):
+        path = os.path.join(self.directory, "modified.bin")
+        with open(path, "wb") as cache_file:
+            cache_file.write(data)
+        os.environ[precompute.CACHE_ENV] = path
+        return path
+
+    def test_known_tables_match_computed_tables(self):
+        for curve in (NIST256p, NIST384p, NIST521p, SECP256k1):
+            generator = curve.generator
+            self.assertEqual(
+                precompute.load(generator), generator._compute_precompute()
+            )
+
+    def test_generator_uses_cached_table(self):
+        generator = fresh_generator(NIST256p.generator)
+
+        self.assertEqual(generator * 12345, NIST256p.generator * 12345)
+        self.assertEqual(
+            generator._PointJacobi__precompute,
+            NIST256p.generator._compute_precompute(),
+        )
+
+    def test_cache_disabled(self):
+        os.environ[precompute.CACHE_ENV] = ""
+
+        self.assertIsNone(precompute.load(NIST256p.generator))
+
+    def test_missing_file(self):
+        os.environ[precompute.CACHE_ENV] = os.path.join(
+            self.directory, "missing.bin"
+        )
+
+        self.assertIsNone(precompute.load(NIST256p.generator))
+
+    def test_falls_through_to_next_file(self):
+        missing = os.path.join(self.directory, "missing.bin")
+        os.environ[precompute.CACHE_ENV] = os.pathsep.join(
+            [missing, self.path]
+        )
+
+        self.assertIsNotNone(precompute.load(NIST256p.generator))
+
+    def test_corrupted_point(self):
+        data = bytearray(self.data)
+        data[-1] ^= 1
+        self.write(bytes(data))
+
+        # the last entry is secp256k1, the others are still usable
+        self.assertIsNone(precompute.load(SECP256k1.generator))
+        self.assertIsNotNone(precompute.load(NIST256p.generator))
+
+    def test_truncated_file(self):
+        self.write(self.data[:-1])
+
+        self.assertIsNone(precompute.load(NIST256p.generator))
+
+    def test_wrong_magic(self):
+        self.write(b"XXXX" + self.data[4:])
+
+        self.assertIsNone(precompute.load(NIST256p.generator))
+
+    def test_unsupported_version(self):
+        self.write(self.data[:4] + b"\x02" + self.data[5:])
+
+        self.assertIsNone(precompute.load(NIST256p.generator))
+
+    def test_empty_file(self):
+        self.write(b"")
+
+        self.assertIsNone(precompute.load(NIST256p.generator))
+
+    def test_unknown_generator_not_loaded(self):
+        path = os.path.join(self.directory, "brainpool.bin")
+        precompute.save(path, [generator_brainpoolp160r1])
+        os.environ[precompute.CACHE_ENV] = path
+
+        self.assertIsNone(precompute.load(generator_brainpoolp160r1))
+
+    def test_save_replaces_file_read_before(self):
+        path = self.write(b"")
+        self.assertIsNone(precompute.load(NIST256p.generator))
+
+        precompute.save(path, [NIST256p.generator])
+
+        self.assertIsNotNone(precompute.load(NIST256p.generator))
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o644)
@@ -1,32 +1,48 @@
+# Probe for the cryptography backend once: every failed attempt re-executes
+# cryptography_backend up to its failing import, which adds up at cold start.
 try:
-    from jose.backends.cryptography_backend import get_random_bytes  # noqa: F401
+    from jose.backends import cryptography_backend as _cryptography_backend
 except ImportError:
+    _cryptography_backend = None
+
+if _cryptography_backend is not None:
+    from jose.backends.cryptography_backend import get_random_bytes  # noqa: F401
+else:
     try:
         from jose.backends.pycrypto_backend import get_random_bytes  # noqa: F401
     except ImportError:
         from jose.backends.native import get_random_bytes  # noqa: F401
 
-try:
+if _cryptography_backend is not None:
     from jose.backends.cryptography_backend import CryptographyRSAKey as RSAKey  # noqa: F401
-except ImportError:
+else:
     try:
         from jose.backends.rsa_backend import RSAKey  # noqa: F401
     except ImportError:
         RSAKey = None
 
-try:
-    from jose.backends.cryptography_backend import CryptographyECKey as ECKey  # noqa: F401
-except ImportError:
-    from jose.backends.ecdsa_backend import ECDSAECKey as ECKey  # noqa: F401
-
-try:
+if _cryptography_backend is not None:
     from jose.backends.cryptography_backend import CryptographyAESKey as AESKey  # noqa: F401
-except ImportError:
+else:
     AESKey = None
 
-try:
+if _cryptography_backend is not None:
     from jose.backends.cryptography_backend import CryptographyHMACKey as HMACKey  # noqa: F401
-except ImportError:
+else:
     from jose.backends.native import HMACKey  # noqa: F401
 
 from .base import DIRKey  # noqa: F401
+
+
+def __getattr__(name):
+    # The pure python EC backend pulls in the whole ecdsa package, which is a
+    # large share of cold start for RSA-only callers, so it is only imported
+    # the first time ECKey is asked for.
+    if name == "ECKey":
+        if _cryptography_backend is not None:
+            from jose.backends.cryptography_backend import CryptographyECKey as ECKey
+        else:
+            from jose.backends.ecdsa_backend import ECDSAECKey as ECKey
+        globals()["ECKey"] = ECKey
+        return ECKey
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
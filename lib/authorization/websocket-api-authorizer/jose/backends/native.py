@@ -27,7 +27,7 @@ class HMACKey(Key):
         self._hash_alg = self.HASHES.get(algorithm)
 
         if isinstance(key, dict):
-            self.prepared_key = self._process_jwk(key)
+            self._prepare(self._process_jwk(key))
             return
 
         if not isinstance(key, str) and not isinstance(key, bytes):
@@ -49,7 +49,13 @@ class HMACKey(Key):
                 " should not be used as an HMAC secret."
             )
 
+        self._prepare(key)
+
+    def _prepare(self, key):
         self.prepared_key = key
+        # Keyed once: hmac.new() pads and hashes the key into the inner and
+        # outer states on every call, copy() only duplicates those states
+        self._keyed = hmac.new(key, digestmod=self._hash_alg)
 
     def _process_jwk(self, jwk_dict):
         if not jwk_dict.get("kty") == "oct":
@@ -63,11 +69,28 @@ class HMACKey(Key):
         return k
 
     def sign(self, msg):
-        return hmac.new(self.prepared_key, msg, self._hash_alg).digest()
+        mac = self._keyed.copy()
+        mac.update(msg)
+        return mac.digest()
 
     def verify(self, msg, sig):
         return hmac.compare_digest(sig, self.sign(msg))
 
+    def verify_many(self, items):
+        """
+        Verifies a batch of (msg, sig) pairs with this key.
+
+        Returns a list of booleans, one per pair, in the same order.
+        """
+        keyed = self._keyed
+        compare = hmac.compare_digest
+        results = []
+        for msg, sig in items:
+            mac = keyed.copy()
+            mac.update(msg)
+            results.append(compare(sig, mac.digest()))
+        return results
+
     def to_dict(self):
         return {
             "alg": self._algorithm,
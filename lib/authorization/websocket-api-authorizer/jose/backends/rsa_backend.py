@@ -3,14 +3,10 @@ import warnings
 
 import rsa as pyrsa
 import rsa.pem as pyrsa_pem
-from pyasn1.error import PyAsn1Error
 from rsa import DecryptionError
 
-from jose.backends._asn1 import (
-    rsa_private_key_pkcs1_to_pkcs8,
-    rsa_private_key_pkcs8_to_pkcs1,
-    rsa_public_key_pkcs1_to_pkcs8,
-)
+# jose.backends._asn1 (and with it pyasn1) is imported inside the PKCS8 code
+# paths below: verifying with a JWK never needs it and pyasn1 is slow to load.
 from jose.backends.base import Key
 from jose.constants import ALGORITHMS
 from jose.exceptions import JWEError, JWKError
@@ -135,6 +131,8 @@ class RSAKey(Key):
             ALGORITHMS.RS512: self.SHA512,
         }.get(algorithm)
         self._algorithm = algorithm
+        # Built on the first verify(); keys are reused across many tokens
+        self._verifier = None
 
         if isinstance(key, dict):
             self._prepared_key = self._process_jwk(key)
@@ -159,6 +157,10 @@ class RSAKey(Key):
                     except ValueError:
                         try:
                             der = pyrsa_pem.load_pem(key, b"PRIVATE KEY")
+                            from pyasn1.error import PyAsn1Error
+
+                            from jose.backends._asn1 import rsa_private_key_pkcs8_to_pkcs1
+
                             try:
                                 pkcs1_key = rsa_private_key_pkcs8_to_pkcs1(der)
                             except PyAsn1Error:
@@ -206,8 +208,12 @@ class RSAKey(Key):
     def verify(self, msg, sig):
         if not self.is_public():
             warnings.warn("Attempting to verify a message with a private key. " "This is not recommended.")
+        if self._verifier is None:
+            # Only the hash this key's alg names is accepted, as RFC 7518 requires
+            hash_methods = (self.hash_alg,) if self.hash_alg else None
+            self._verifier = pyrsa.pkcs1.Verifier(self._prepared_key, hash_methods)
         try:
-            pyrsa.verify(msg, sig, self._prepared_key)
+            self._verifier.verify(msg, sig)
             return True
         except pyrsa.pkcs1.VerificationError:
             return False
@@ -221,6 +227,7 @@ class RSAKey(Key):
         return self.__class__(pyrsa.PublicKey(n=self._prepared_key.n, e=self._prepared_key.e), self._algorithm)
 
     def to_pem(self, pem_format="PKCS8"):
+        from jose.backends._asn1 import rsa_private_key_pkcs1_to_pkcs8, rsa_public_key_pkcs1_to_pkcs8
 
         if isinstance(self._prepared_key, pyrsa.PrivateKey):
             der = self._prepared_key.save_pkcs1(format="DER")
@@ -1,17 +1,18 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
 from jose.backends.base import Key
 from jose.constants import ALGORITHMS
 from jose.exceptions import JWKError
+from jose.utils import base64url_encode
 
 try:
     from jose.backends import RSAKey  # noqa: F401
 except ImportError:
     pass
 
-try:
-    from jose.backends import ECKey  # noqa: F401
-except ImportError:
-    pass
-
 try:
     from jose.backends import AESKey  # noqa: F401
 except ImportError:
@@ -28,6 +29,15 @@ except ImportError:
     pass
 
 
+def __getattr__(name):
+    # ECKey is resolved lazily by jose.backends, see the note there
+    if name == "ECKey":
+        from jose.backends import ECKey
+
+        return ECKey
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_key(algorithm):
     if algorithm in ALGORITHMS.KEYS:
         return ALGORITHMS.KEYS[algorithm]
@@ -64,6 +74,11 @@ def construct(key_data, algorithm=None):
     """
     Construct a Key object for the given algorithm with the given
     key_data.
+
+    Public RSA and EC keys, given as a JWK or as PEM, are memoised: the key
+    object built for the same key and algorithm is returned again (see
+    :data:`CONSTRUCT_CACHE_SIZE`). Private and symmetric keys are always
+    constructed afresh, so no secret material is kept by the cache.
     """
 
     # Allow for pulling the algorithm off of the passed in jwk.
@@ -76,4 +91,192 @@ def construct(key_data, algorithm=None):
     key_class = get_key(algorithm)
     if not key_class:
         raise JWKError("Unable to find an algorithm for key: %s" % key_data)
-    return key_class(key_data, algorithm)
+
+    cache_key = _construct_cache_key(key_data, algorithm, key_class)
+    if cache_key is None:
+        return key_class(key_data, algorithm)
+    key = _construct_cache.get(cache_key)
+    if key is None:
+        key = key_class(key_data, algorithm)
+        _construct_cache.put(cache_key, key)
+    return key
+
+
+def thumbprint(key_data):
+    """
+    Returns the RFC 7638 thumbprint of a JWK dict: the base64url-encoded
+    SHA-256 digest of its required members in canonical JSON form.
+    """
+    required = _THUMBPRINT_MEMBERS.get(key_data.get("kty"))
+    if required is None:
+        raise JWKError("Unable to compute a thumbprint for key type: %s" % key_data.get("kty"))
+    try:
+        members = {name: key_data[name] for name in required}
+    except KeyError as e:
+        raise JWKError("JWK is missing the required member %s" % e)
+    canonical = json.dumps(members, sort_keys=True, separators=(",", ":"))
+    return base64url_encode(hashlib.sha256(canonical.encode("utf-8")).digest()).decode("ascii")
+
+
+# Members that define a key's thumbprint, per RFC 7638 section 3.2
+_THUMBPRINT_MEMBERS = {
+    "RSA": ("e", "kty", "n"),
+    "EC": ("crv", "kty", "x", "y"),
+    "oct": ("k", "kty"),
+}
+
+# Number of public key objects construct() keeps
+CONSTRUCT_CACHE_SIZE = 128
+
+
+class _KeyCache:
+    """Small thread-safe LRU of constructed key objects."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._keys = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, cache_key):
+        with self._lock:
+            key = self._keys.get(cache_key)
+            if key is None:
+                self.misses += 1
+                return None
+            self._keys.move_to_end(cache_key)
+            self.hits += 1
+            return key
+
+    def put(self, cache_key, key):
+        with self._lock:
+            self._keys[cache_key] = key
+            self._keys.move_to_end(cache_key)
+            while len(self._keys) > self.maxsize:
+                self._keys.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._keys.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._keys)
+
+
+_construct_cache = _KeyCache(CONSTRUCT_CACHE_SIZE)
+
+
+def clear_construct_cache():
+    """Drops every key object memoised by :func:`construct`."""
+    _construct_cache.clear()
+
+
+def _construct_cache_key(key_data, algorithm, key_class):
+    if algorithm not in ALGORITHMS.RSA_DS and algorithm not in ALGORITHMS.EC_DS:
+        return None
+    if isinstance(key_data, dict):
+        if "d" in key_data or key_data.get("kty") not in ("RSA", "EC"):
+            return None
+        try:
+            return (key_class, algorithm, thumbprint(key_data))
+        except (JWKError, TypeError):
+            return None
+    if isinstance(key_data, str):
+        key_data = key_data.encode("utf-8")
+    if isinstance(key_data, bytes):
+        if b"-----BEGIN" not in key_data or b"PRIVATE" in key_data:
+            return None
+        return (key_class, algorithm, hashlib.sha256(key_data).hexdigest())
+    return None
+
+
+class JWKSet:
+    """
+    A JWK Set (RFC 7517 section 5) whose keys are constructed once and
+    indexed by ``kid``, so verifying a token that names its key costs a
+    dictionary lookup and a single signature check instead of one check per
+    key in the set.
+
+    Keys that declare an ``alg`` are constructed up front; keys without one
+    are constructed the first time a token asks for them with a compatible
+    algorithm and kept from then on. Keys that can't be constructed, or
+    whose ``kty`` or ``alg`` isn't a string, are left out of the set.
+    """
+
+    # Key types and the algorithms they can be used with, for JWKs without "alg"
+    _KTY_ALGORITHMS = {
+        "RSA": ALGORITHMS.RSA,
+        "EC": ALGORITHMS.EC,
+        "oct": ALGORITHMS.HMAC,
+    }
+
+    def __init__(self, jwks):
+        """
+        Args:
+            jwks (dict or list): A JWK Set (``{"keys": [...]}``) or a list of JWKs.
+        """
+        if isinstance(jwks, dict):
+            jwks = jwks.get("keys", ())
+        self._entries = []
+        self._by_kid = {}
+        for jwk in jwks:
+            if not isinstance(jwk, dict):
+                raise JWKError("JWK Set members must be JWK dicts: %s" % jwk)
+            if not isinstance(jwk.get("kty"), str) or not isinstance(jwk.get("alg", ""), str):
+                continue
+            entry = {"jwk": jwk, "alg": jwk.get("alg"), "keys": {}}
+            if entry["alg"]:
+                try:
+                    entry["keys"][entry["alg"]] = construct(jwk, entry["alg"])
+                except (JWKError, ValueError):
+                    continue
+            self._entries.append(entry)
+            if isinstance(jwk.get("kid"), str):
+                self._by_kid.setdefault(jwk["kid"], []).append(entry)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, kid):
+        return isinstance(kid, str) and kid in self._by_kid
+
+    def get(self, kid, algorithm=None):
+        """
+        Returns the key with the given ``kid`` usable with ``algorithm``, or None.
+        """
+        if not isinstance(kid, str) or not isinstance(algorithm, (str, type(None))):
+            return None
+        for key in self._keys_for(self._by_kid.get(kid, ()), algorithm):
+            return key
+        return None
+
+    def candidates(self, kid, algorithm):
+        """
+        Returns the keys that may have signed a token with the given ``kid``
+        and ``alg`` headers: only the keys with that ``kid`` when the header
+        is present, otherwise every key usable with ``algorithm``.
+
+        Header values that aren't strings (a list, an object) match no key.
+        """
+        if not isinstance(algorithm, (str, type(None))) or not isinstance(kid, (str, type(None))):
+            return []
+        entries = self._entries if kid is None else self._by_kid.get(kid, ())
+        return list(self._keys_for(entries, algorithm))
+
+    def _keys_for(self, entries, algorithm):
+        for entry in entries:
+            if entry["alg"]:
+                if algorithm is None or entry["alg"] == algorithm:
+                    yield entry["keys"][entry["alg"]]
+                continue
+            if algorithm is None or algorithm not in self._KTY_ALGORITHMS.get(entry["jwk"].get("kty"), ()):
+                continue
+            key = entry["keys"].get(algorithm)
+            if key is None:
+                try:
+                    key = entry["keys"][algorithm] = construct(entry["jwk"], algorithm)
+                except (JWKError, ValueError):
+                    continue
+            yield key
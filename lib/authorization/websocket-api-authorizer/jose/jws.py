@@ -50,8 +50,9 @@ def verify(token, key, algorithms, verify=True):
 
     Args:
         token (str): A signed JWS to be verified.
-        key (str or dict): A key to attempt to verify the payload with. Can be
-            individual JWK or JWK set.
+        key (str or dict or JWKSet): A key to attempt to verify the payload with. Can be
+            individual JWK or JWK set. With a :class:`jose.jwk.JWKSet` only the key named
+            by the token's ``kid`` header is tried.
         algorithms (str or list): Valid algorithms that should be used to verify the JWS.
 
     Returns:
@@ -170,15 +171,33 @@ def _sign_header_and_claims(encoded_header, encoded_claims, algorithm, key):
 
 
 def _load(jwt):
+    signing_input, header_segment, claims_segment, crypto_segment = _split(jwt)
+    header = _load_header(header_segment)
+    payload = _load_payload(claims_segment)
+    signature = _load_signature(crypto_segment)
+    return (header, payload, signing_input, signature)
+
+
+def _split(jwt):
     if isinstance(jwt, str):
         jwt = jwt.encode("utf-8")
     try:
         signing_input, crypto_segment = jwt.rsplit(b".", 1)
         header_segment, claims_segment = signing_input.split(b".", 1)
-        header_data = base64url_decode(header_segment)
     except ValueError:
         raise JWSError("Not enough segments")
-    except (TypeError, binascii.Error):
+    except TypeError:
+        raise JWSError("Invalid header padding")
+    return signing_input, header_segment, claims_segment, crypto_segment
+
+
+def _load_header(header_segment):
+    try:
+        header_data = base64url_decode(header_segment)
+    except binascii.Error:
+        # binascii.Error is a ValueError, which has always been reported this way
+        raise JWSError("Not enough segments")
+    except TypeError:
         raise JWSError("Invalid header padding")
 
     try:
@@ -188,19 +207,22 @@ def _load(jwt):
 
     if not isinstance(header, Mapping):
         raise JWSError("Invalid header string: must be a json object")
+    return header
+
 
+def _load_payload(claims_segment):
     try:
-        payload = base64url_decode(claims_segment)
+        return base64url_decode(claims_segment)
     except (TypeError, binascii.Error):
         raise JWSError("Invalid payload padding")
 
+
+def _load_signature(crypto_segment):
     try:
-        signature = base64url_decode(crypto_segment)
+        return base64url_decode(crypto_segment)
     except (TypeError, binascii.Error):
         raise JWSError("Invalid crypto padding")
 
-    return (header, payload, signing_input, signature)
-
 
 def _sig_matches_keys(keys, signing_input, signature, alg):
     for key in keys:
@@ -256,7 +278,10 @@ def _verify_signature(signing_input, header, signature, key="", algorithms=None)
     if algorithms is not None and alg not in algorithms:
         raise JWSError("The specified alg value is not allowed")
 
-    keys = _get_keys(key)
+    if isinstance(key, jwk.JWKSet):
+        keys = key.candidates(header.get("kid"), alg)
+    else:
+        keys = _get_keys(key)
     try:
         if not _sig_matches_keys(keys, signing_input, signature, alg):
             raise JWSSignatureError()
@@ -53,13 +53,24 @@ def encode(claims, key, algorithm=ALGORITHMS.HS256, headers=None, access_token=N
     return jws.sign(claims, key, headers=headers, algorithm=algorithm)
 
 
-def decode(token, key, algorithms=None, options=None, audience=None, issuer=None, subject=None, access_token=None):
+def decode(
+    token,
+    key,
+    algorithms=None,
+    options=None,
+    audience=None,
+    issuer=None,
+    subject=None,
+    access_token=None,
+    claims_validator=None,
+):
     """Verifies a JWT string's signature and validates reserved claims.
 
     Args:
-        token (str): A signed JWS to be verified.
-        key (str or dict): A key to attempt to verify the payload with. Can be
-            individual JWK or JWK set.
+        token (str or ParsedJWT): A signed JWS to be verified.
+        key (str or dict or JWKSet): A key to attempt to verify the payload with. Can be
+            individual JWK or JWK set. With a :class:`jose.jwk.JWKSet` only the key named
+            by the token's ``kid`` header is tried.
         algorithms (str or list): Valid algorithms that should be used to verify the JWS.
         audience (str): The intended audience of the token.  If the "aud" claim is
             included in the claim set, then the audience must be included and must equal
@@ -73,6 +84,9 @@ def decode(token, key, algorithms=None, options=None, audience=None, issuer=None
         access_token (str): An access token string. If the "at_hash" claim is included in the
             claim set, then the access_token must be included, and it must match
             the "at_hash" claim.
+        claims_validator (ClaimsValidator): A validator built once and reused across
+            calls. When given, it replaces audience, issuer, subject and the claim
+            options; only ``verify_signature`` is still read from options.
         options (dict): A dictionary of options for skipping validation steps.
 
             defaults = {
@@ -112,59 +126,115 @@ def decode(token, key, algorithms=None, options=None, audience=None, issuer=None
 
     """
 
-    defaults = {
-        "verify_signature": True,
-        "verify_aud": True,
-        "verify_iat": True,
-        "verify_exp": True,
-        "verify_nbf": True,
-        "verify_iss": True,
-        "verify_sub": True,
-        "verify_jti": True,
-        "verify_at_hash": True,
-        "require_aud": False,
-        "require_iat": False,
-        "require_exp": False,
-        "require_nbf": False,
-        "require_iss": False,
-        "require_sub": False,
-        "require_jti": False,
-        "require_at_hash": False,
-        "leeway": 0,
-    }
+    parsed = token if isinstance(token, ParsedJWT) else ParsedJWT(token)
+    options = _options(options)
 
-    if options:
-        defaults.update(options)
+    if options.get("verify_signature", True):
+        parsed.verify_signature(key, algorithms)
 
-    verify_signature = defaults.get("verify_signature", True)
+    if claims_validator is None:
+        claims_validator = ClaimsValidator(audience=audience, issuer=issuer, subject=subject, options=options)
+    return claims_validator(parsed.claims, algorithm=parsed.header.get("alg"), access_token=access_token)
 
-    try:
-        payload = jws.verify(token, key, algorithms, verify=verify_signature)
-    except JWSError as e:
-        raise JWTError(e)
 
-    # Needed for at_hash verification
-    algorithm = jws.get_unverified_header(token)["alg"]
+class ParsedJWT:
+    """A JWT split and decoded once, for callers that need its header, claims
+    and signature separately.
 
-    try:
-        claims = json.loads(payload.decode("utf-8"))
-    except ValueError as e:
-        raise JWTError("Invalid payload string: %s" % e)
+    The header is decoded on construction; the claims and signature are
+    decoded the first time they are used and kept, so a token refused on its
+    header never pays for the rest. ``signing_input`` is the raw
+    ``header.payload`` bytes the signature covers. :func:`decode` accepts a
+    ParsedJWT in place of a token string.
 
-    if not isinstance(claims, Mapping):
-        raise JWTError("Invalid payload string: must be a json object")
-
-    _validate_claims(
-        claims,
-        audience=audience,
-        issuer=issuer,
-        subject=subject,
-        algorithm=algorithm,
-        access_token=access_token,
-        options=defaults,
-    )
+    Examples:
 
-    return claims
+        >>> parsed = jwt.ParsedJWT(token)
+        >>> key = keys[parsed.header["kid"]]
+        >>> parsed.verify_signature(key, algorithms="RS256")
+        >>> parsed.validate_claims(audience="client-id")
+        >>> parsed.claims["sub"]
+
+    """
+
+    __slots__ = ("signing_input", "header", "_claims_segment", "_crypto_segment", "_claims", "_signature")
+
+    def __init__(self, token):
+        """
+        Args:
+            token (str or bytes): A signed JWT.
+
+        Raises:
+            JWTError: If the token or its header can't be decoded.
+        """
+        try:
+            self.signing_input, header_segment, self._claims_segment, self._crypto_segment = jws._split(token)
+            self.header = jws._load_header(header_segment)
+        except JWSError as e:
+            raise JWTError(e)
+        self._claims = None
+        self._signature = None
+
+    @property
+    def claims(self):
+        """dict: The decoded claims set. Raises JWTError if it isn't a JSON object."""
+        if self._claims is None:
+            try:
+                payload = jws._load_payload(self._claims_segment)
+            except JWSError as e:
+                raise JWTError(e)
+
+            try:
+                claims = json.loads(payload.decode("utf-8"))
+            except ValueError as e:
+                raise JWTError("Invalid payload string: %s" % e)
+
+            if not isinstance(claims, Mapping):
+                raise JWTError("Invalid payload string: must be a json object")
+            self._claims = claims
+        return self._claims
+
+    @property
+    def signature(self):
+        """bytes: The decoded signature. Raises JWTError if it can't be decoded."""
+        if self._signature is None:
+            try:
+                self._signature = jws._load_signature(self._crypto_segment)
+            except JWSError as e:
+                raise JWTError(e)
+        return self._signature
+
+    def verify_signature(self, key, algorithms=None):
+        """Verifies the signature with ``key``, which may be anything :func:`decode` accepts.
+
+        Raises:
+            JWTError: If the signature is invalid in any way.
+        """
+        try:
+            jws._verify_signature(self.signing_input, self.header, self.signature, key, algorithms)
+        except JWSError as e:
+            raise JWTError(e)
+
+    def validate_claims(self, audience=None, issuer=None, subject=None, access_token=None, options=None):
+        """Validates the reserved claims as :func:`decode` does, without checking the signature.
+
+        Returns:
+            dict: The claims set.
+
+        Raises:
+            ExpiredSignatureError: If the signature has expired.
+            JWTClaimsError: If any claim is invalid in any way.
+        """
+        _validate_claims(
+            self.claims,
+            audience=audience,
+            issuer=issuer,
+            subject=subject,
+            algorithm=self.header.get("alg"),
+            access_token=access_token,
+            options=_options(options),
+        )
+        return self.claims
 
 
 def get_unverified_header(token):
@@ -233,6 +303,35 @@ def get_unverified_claims(token):
     return claims
 
 
+_DEFAULT_OPTIONS = {
+    "verify_signature": True,
+    "verify_aud": True,
+    "verify_iat": True,
+    "verify_exp": True,
+    "verify_nbf": True,
+    "verify_iss": True,
+    "verify_sub": True,
+    "verify_jti": True,
+    "verify_at_hash": True,
+    "require_aud": False,
+    "require_iat": False,
+    "require_exp": False,
+    "require_nbf": False,
+    "require_iss": False,
+    "require_sub": False,
+    "require_jti": False,
+    "require_at_hash": False,
+    "leeway": 0,
+}
+
+
+def _options(options=None):
+    defaults = dict(_DEFAULT_OPTIONS)
+    if options:
+        defaults.update(options)
+    return defaults
+
+
 def _validate_iat(claims):
     """Validates that the 'iat' claim is valid.
 
@@ -254,7 +353,7 @@ def _validate_iat(claims):
         raise JWTClaimsError("Issued At claim (iat) must be an integer.")
 
 
-def _validate_nbf(claims, leeway=0):
+def _validate_nbf(claims, leeway=0, now=None):
     """Validates that the 'nbf' claim is valid.
 
     The "nbf" (not before) claim identifies the time before which the JWT
@@ -268,6 +367,7 @@ def _validate_nbf(claims, leeway=0):
     Args:
         claims (dict): The claims dictionary to validate.
         leeway (int): The number of seconds of skew that is allowed.
+        now (int): The current time, if the caller already has it.
     """
 
     if "nbf" not in claims:
@@ -278,13 +378,14 @@ def _validate_nbf(claims, leeway=0):
     except ValueError:
         raise JWTClaimsError("Not Before claim (nbf) must be an integer.")
 
-    now = timegm(datetime.utcnow().utctimetuple())
+    if now is None:
+        now = timegm(datetime.utcnow().utctimetuple())
 
     if nbf > (now + leeway):
         raise JWTClaimsError("The token is not yet valid (nbf)")
 
 
-def _validate_exp(claims, leeway=0):
+def _validate_exp(claims, leeway=0, now=None):
     """Validates that the 'exp' claim is valid.
 
     The "exp" (expiration time) claim identifies the expiration time on
@@ -298,6 +399,7 @@ def _validate_exp(claims, leeway=0):
     Args:
         claims (dict): The claims dictionary to validate.
         leeway (int): The number of seconds of skew that is allowed.
+        now (int): The current time, if the caller already has it.
     """
 
     if "exp" not in claims:
@@ -308,7 +410,8 @@ def _validate_exp(claims, leeway=0):
     except ValueError:
         raise JWTClaimsError("Expiration Time claim (exp) must be an integer.")
 
-    now = timegm(datetime.utcnow().utctimetuple())
+    if now is None:
+        now = timegm(datetime.utcnow().utctimetuple())
 
     if exp < (now - leeway):
         raise ExpiredSignatureError("Signature has expired.")
@@ -456,41 +559,107 @@ def _validate_at_hash(claims, access_token, algorithm):
 
 
 def _validate_claims(claims, audience=None, issuer=None, subject=None, algorithm=None, access_token=None, options=None):
+    validator = ClaimsValidator(audience=audience, issuer=issuer, subject=subject, options=options)
+    validator(claims, algorithm=algorithm, access_token=access_token)
+
+
+class ClaimsValidator:
+    """Validates reserved claims the way :func:`decode` does, with the
+    checks worked out once up front.
+
+    The options are resolved when the validator is built, so each call only
+    runs the checks that are enabled, reading the clock at most once. Build
+    one per configuration and reuse it for every token:
 
-    leeway = options.get("leeway", 0)
+        >>> validate = jwt.ClaimsValidator(audience='client-id', issuer=ISSUER)
+        >>> claims = jwt.decode(token, keys, algorithms='RS256', claims_validator=validate)
 
-    if isinstance(leeway, timedelta):
-        leeway = timedelta_total_seconds(leeway)
-    required_claims = [e[len("require_") :] for e in options.keys() if e.startswith("require_") and options[e]]
-    for require_claim in required_claims:
-        if require_claim not in claims:
-            raise JWTError('missing required key "%s" among claims' % require_claim)
-        else:
-            options["verify_" + require_claim] = True  # override verify when required
+    Args:
+        audience (str): The intended audience of the token.
+        issuer (str or iterable): Acceptable value(s) for the issuer of the token.
+        subject (str): The subject of the token.
+        options (dict): The ``verify_*``, ``require_*`` and ``leeway`` options
+            accepted by :func:`decode`.
 
-    if not isinstance(audience, ((str,), type(None))):
-        raise JWTError("audience must be a string or None")
+    Raises:
+        JWTError: If the audience is neither a string nor None.
+    """
 
-    if options.get("verify_iat"):
+    def __init__(self, audience=None, issuer=None, subject=None, options=None):
+        if not isinstance(audience, ((str,), type(None))):
+            raise JWTError("audience must be a string or None")
+
+        options = _options(options)
+        leeway = options.get("leeway", 0)
+        if isinstance(leeway, timedelta):
+            leeway = timedelta_total_seconds(leeway)
+
+        self.audience = audience
+        self.issuer = (issuer,) if isinstance(issuer, str) else issuer
+        self.subject = subject
+        self.leeway = leeway
+        self.required = tuple(e[len("require_") :] for e in options if e.startswith("require_") and options[e])
+
+        # A required claim is always verified, whatever its verify_ option says
+        def enabled(claim):
+            return bool(options.get("verify_" + claim)) or claim in self.required
+
+        checks = [
+            ("iat", self._check_iat),
+            ("nbf", self._check_nbf),
+            ("exp", self._check_exp),
+            ("aud", self._check_aud),
+            ("iss", self._check_iss),
+            ("sub", self._check_sub),
+            ("jti", self._check_jti),
+            ("at_hash", self._check_at_hash),
+        ]
+        self._checks = tuple(check for claim, check in checks if enabled(claim))
+        self._needs_time = enabled("nbf") or enabled("exp")
+
+    def __call__(self, claims, algorithm=None, access_token=None):
+        """Validates ``claims``, returning them unchanged.
+
+        Args:
+            claims (dict): The decoded claims set.
+            algorithm (str): The token's ``alg`` header, needed for ``at_hash``.
+            access_token (str): The access token to compare ``at_hash`` against.
+
+        Raises:
+            JWTError: If a required claim is missing.
+            ExpiredSignatureError: If the signature has expired.
+            JWTClaimsError: If any claim is invalid in any way.
+        """
+        for require_claim in self.required:
+            if require_claim not in claims:
+                raise JWTError('missing required key "%s" among claims' % require_claim)
+
+        now = timegm(datetime.utcnow().utctimetuple()) if self._needs_time else None
+        for check in self._checks:
+            check(claims, now, algorithm, access_token)
+        return claims
+
+    def _check_iat(self, claims, now, algorithm, access_token):
         _validate_iat(claims)
 
-    if options.get("verify_nbf"):
-        _validate_nbf(claims, leeway=leeway)
+    def _check_nbf(self, claims, now, algorithm, access_token):
+        _validate_nbf(claims, leeway=self.leeway, now=now)
 
-    if options.get("verify_exp"):
-        _validate_exp(claims, leeway=leeway)
+    def _check_exp(self, claims, now, algorithm, access_token):
+        _validate_exp(claims, leeway=self.leeway, now=now)
 
-    if options.get("verify_aud"):
-        _validate_aud(claims, audience=audience)
+    def _check_aud(self, claims, now, algorithm, access_token):
+        _validate_aud(claims, audience=self.audience)
 
-    if options.get("verify_iss"):
-        _validate_iss(claims, issuer=issuer)
+    def _check_iss(self, claims, now, algorithm, access_token):
+        if self.issuer is not None and claims.get("iss") not in self.issuer:
+            raise JWTClaimsError("Invalid issuer")
 
-    if options.get("verify_sub"):
-        _validate_sub(claims, subject=subject)
+    def _check_sub(self, claims, now, algorithm, access_token):
+        _validate_sub(claims, subject=self.subject)
 
-    if options.get("verify_jti"):
+    def _check_jti(self, claims, now, algorithm, access_token):
         _validate_jti(claims)
 
-    if options.get("verify_at_hash"):
+    def _check_at_hash(self, claims, now, algorithm, access_token):
         _validate_at_hash(claims, access_token, algorithm)
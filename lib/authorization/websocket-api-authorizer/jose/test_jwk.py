@@ -0,0 +1,137 @@
+import unittest
+
+import rsa
+
+from jose import jwk, jws
+from jose.backends.rsa_backend import RSAKey
+from jose.exceptions import JWSError
+
+
+class TestJWKSet(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        _, private = rsa.newkeys(1024)
+        cls.private_pem = private.save_pkcs1().decode()
+        cls.public_jwk = RSAKey(cls.private_pem, "RS256").public_key().to_dict()
+        cls.public_jwk["kid"] = "k1"
+        cls.token = jws.sign({"sub": "user-1"}, cls.private_pem, headers={"kid": "k1"}, algorithm="RS256")
+
+    def jwk(self, **changes):
+        value = dict(self.public_jwk)
+        value.update(changes)
+        return value
+
+    def test_get_by_kid(self):
+        keys = jwk.JWKSet({"keys": [self.jwk()]})
+
+        self.assertIsNotNone(keys.get("k1", "RS256"))
+        self.assertIsNone(keys.get("k2", "RS256"))
+        self.assertIn("k1", keys)
+
+    def test_key_without_alg_is_constructed_for_compatible_algorithm(self):
+        key = self.jwk()
+        del key["alg"]
+        keys = jwk.JWKSet([key])
+
+        self.assertIsNotNone(keys.get("k1", "RS256"))
+        self.assertIsNone(keys.get("k1", "HS256"))
+
+    def test_verify_uses_kid(self):
+        keys = jwk.JWKSet([self.jwk(kid="other"), self.jwk()])
+
+        self.assertEqual(jws.verify(self.token, keys, algorithms=["RS256"]), b'{"sub":"user-1"}')
+
+    def test_non_string_alg_in_jwk_is_skipped(self):
+        keys = jwk.JWKSet({"keys": [self.jwk(alg=["RS256"]), self.jwk(alg={"a": 1}, kid="k2")]})
+
+        self.assertEqual(len(keys), 0)
+        self.assertIsNone(keys.get("k1", "RS256"))
+
+    def test_non_string_kty_in_jwk_is_skipped(self):
+        key = self.jwk(kty=["RSA"])
+        del key["alg"]
+
+        self.assertEqual(len(jwk.JWKSet([key])), 0)
+
+    def test_non_string_kid_in_jwk_is_not_indexed(self):
+        keys = jwk.JWKSet([self.jwk(kid=["k1"])])
+
+        self.assertEqual(len(keys), 1)
+        self.assertIsNone(keys.get("k1", "RS256"))
+
+    def test_non_string_lookup_values_match_nothing(self):
+        key = self.jwk()
+        del key["alg"]
+        keys = jwk.JWKSet([key])
+
+        self.assertIsNone(keys.get("k1", ["RS256"]))
+        self.assertIsNone(keys.get(["k1"], "RS256"))
+        self.assertEqual(keys.candidates("k1", {"alg": "RS256"}), [])
+        self.assertEqual(keys.candidates({"kid": "k1"}, "RS256"), [])
+        self.assertNotIn(["k1"], keys)
+
+    def test_non_string_kid_header_fails_verification(self):
+        keys = jwk.JWKSet([self.jwk()])
+        token = jws.sign({"sub": "user-1"}, self.private_pem, headers={"kid": ["k1"]}, algorithm="RS256")
+
+        with self.assertRaises(JWSError):
+            jws.verify(token, keys, algorithms=["RS256"])
+
+
+class TestConstructCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        public, private = rsa.newkeys(1024)
+        cls.private_pem = private.save_pkcs1().decode()
+        cls.public_pem = public.save_pkcs1().decode()
+        cls.public_jwk = RSAKey(cls.private_pem, "RS256").public_key().to_dict()
+        cls.private_jwk = RSAKey(cls.private_pem, "RS256").to_dict()
+
+    def setUp(self):
+        jwk.clear_construct_cache()
+        self.addCleanup(jwk.clear_construct_cache)
+
+    def test_public_jwk_is_cached(self):
+        key = jwk.construct(self.public_jwk)
+
+        self.assertIs(jwk.construct(dict(self.public_jwk)), key)
+        self.assertIs(jwk.construct(dict(self.public_jwk, kid="other")), key)
+        self.assertIsNot(jwk.construct(self.public_jwk, "RS512"), key)
+
+    def test_public_pem_is_cached(self):
+        key = jwk.construct(self.public_pem, "RS256")
+
+        self.assertIs(jwk.construct(self.public_pem.encode(), "RS256"), key)
+        self.assertTrue(key.verify(b"message", rsa.sign(b"message", rsa.PrivateKey.load_pkcs1(self.private_pem), "SHA-256")))
+
+    def test_ec_public_pem_is_cached(self):
+        from ecdsa import NIST256p, SigningKey
+
+        pem = SigningKey.generate(NIST256p).verifying_key.to_pem()
+
+        self.assertIs(jwk.construct(pem, "ES256"), jwk.construct(pem, "ES256"))
+
+    def test_private_keys_are_not_cached(self):
+        self.assertIsNot(jwk.construct(self.private_pem, "RS256"), jwk.construct(self.private_pem, "RS256"))
+        self.assertIsNot(jwk.construct(self.private_jwk), jwk.construct(self.private_jwk))
+        self.assertEqual(len(jwk._construct_cache), 0)
+
+    def test_hmac_keys_are_not_cached(self):
+        secret = {"kty": "oct", "k": "c2VjcmV0", "alg": "HS256"}
+
+        self.assertIsNot(jwk.construct("secret", "HS256"), jwk.construct("secret", "HS256"))
+        self.assertIsNot(jwk.construct(secret), jwk.construct(secret))
+        self.assertEqual(len(jwk._construct_cache), 0)
+
+    def test_clear(self):
+        key = jwk.construct(self.public_jwk)
+        jwk.clear_construct_cache()
+
+        self.assertIsNot(jwk.construct(self.public_jwk), key)
+
+    def test_bounded(self):
+        for _ in range(jwk.CONSTRUCT_CACHE_SIZE + 1):
+            public, _ = rsa.newkeys(512)
+            jwk.construct(public.save_pkcs1(), "RS256")
+
+        self.assertEqual(len(jwk._construct_cache), jwk.CONSTRUCT_CACHE_SIZE)
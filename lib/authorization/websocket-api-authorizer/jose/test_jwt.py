@@ -0,0 +1,223 @@
+import itertools
+import time
+import unittest
+from datetime import timedelta
+
+from jose import jws, jwt
+from jose.exceptions import ExpiredSignatureError, JWSError, JWTClaimsError, JWTError
+from jose.utils import timedelta_total_seconds
+
+KEY = "secret"
+ACCESS_TOKEN = "access-token"
+CLAIMS = ("iat", "nbf", "exp", "aud", "iss", "sub", "jti", "at_hash")
+
+
+def previous_decode(token, key, algorithms=None, options=None, audience=None, issuer=None, subject=None,
+                    access_token=None):
+    """jwt.decode as it was before ParsedJWT and ClaimsValidator, kept to compare against."""
+    defaults = dict(jwt._DEFAULT_OPTIONS)
+    if options:
+        defaults.update(options)
+    try:
+        payload = jws.verify(token, key, algorithms, verify=defaults.get("verify_signature", True))
+    except JWSError as e:
+        raise JWTError(e)
+    algorithm = jws.get_unverified_header(token)["alg"]
+    claims = jwt.json.loads(payload.decode("utf-8"))
+
+    leeway = defaults.get("leeway", 0)
+    if isinstance(leeway, timedelta):
+        leeway = timedelta_total_seconds(leeway)
+    for claim in [e[len("require_") :] for e in defaults if e.startswith("require_") and defaults[e]]:
+        if claim not in claims:
+            raise JWTError('missing required key "%s" among claims' % claim)
+        defaults["verify_" + claim] = True
+    if not isinstance(audience, (str, type(None))):
+        raise JWTError("audience must be a string or None")
+    if defaults.get("verify_iat"):
+        jwt._validate_iat(claims)
+    if defaults.get("verify_nbf"):
+        jwt._validate_nbf(claims, leeway=leeway)
+    if defaults.get("verify_exp"):
+        jwt._validate_exp(claims, leeway=leeway)
+    if defaults.get("verify_aud"):
+        jwt._validate_aud(claims, audience=audience)
+    if defaults.get("verify_iss"):
+        jwt._validate_iss(claims, issuer=issuer)
+    if defaults.get("verify_sub"):
+        jwt._validate_sub(claims, subject=subject)
+    if defaults.get("verify_jti"):
+        jwt._validate_jti(claims)
+    if defaults.get("verify_at_hash"):
+        jwt._validate_at_hash(claims, access_token, algorithm)
+    return claims
+
+
+def outcome(function, *args, **kwargs):
+    try:
+        return function(*args, **kwargs)
+    except JWTError as e:
+        return type(e), str(e)
+
+
+def claim_sets():
+    now = int(time.time())
+    valid = {"iat": now, "nbf": now - 10, "exp": now + 60, "aud": "client", "iss": "issuer", "sub": "user-1",
+             "jti": "id-1"}
+    yield "valid", valid
+    for claim in CLAIMS[:-1]:
+        missing = dict(valid)
+        del missing[claim]
+        yield "no " + claim, missing
+    invalid = {"iat": "yesterday", "nbf": now + 60, "exp": now - 5, "aud": "other", "iss": "other",
+               "sub": "user-2", "jti": 7}
+    for claim, value in invalid.items():
+        yield "bad " + claim, dict(valid, **{claim: value})
+
+
+def option_sets():
+    yield {}
+    yield {"leeway": 10}
+    yield {"leeway": timedelta(seconds=10)}
+    for claim in CLAIMS:
+        for verify, require in itertools.product((True, False), repeat=2):
+            yield {"verify_" + claim: verify, "require_" + claim: require}
+    yield {"verify_" + claim: False for claim in CLAIMS}
+    yield {"require_" + claim: True for claim in CLAIMS}
+
+
+class TestDecode(unittest.TestCase):
+    def assertMatchesPrevious(self, token, key=KEY, **kwargs):
+        kwargs.setdefault("algorithms", "HS256")
+        self.assertEqual(outcome(jwt.decode, token, key, **kwargs), outcome(previous_decode, token, key, **kwargs))
+
+    def test_options_match_previous_behaviour(self):
+        for name, claims in claim_sets():
+            for access_token in (None, ACCESS_TOKEN):
+                token = jwt.encode(claims, KEY, access_token=access_token)
+                for options in option_sets():
+                    with self.subTest(claims=name, access_token=access_token, options=options):
+                        self.assertMatchesPrevious(
+                            token, options=options, audience="client", issuer="issuer", subject="user-1",
+                            access_token=ACCESS_TOKEN,
+                        )
+
+    def test_issuer_and_audience_arguments_match_previous_behaviour(self):
+        token = jwt.encode({"aud": "client", "iss": "issuer"}, KEY)
+        for audience, issuer in itertools.product((None, "client", "other", ["client"]),
+                                                  (None, "issuer", ["other", "issuer"], ("other",))):
+            with self.subTest(audience=audience, issuer=issuer):
+                self.assertMatchesPrevious(token, audience=audience, issuer=issuer)
+
+    def test_wrong_at_hash(self):
+        token = jwt.encode({"sub": "user-1"}, KEY, access_token=ACCESS_TOKEN)
+
+        self.assertMatchesPrevious(token, access_token="other")
+        self.assertMatchesPrevious(token)
+
+    def test_signature(self):
+        token = jwt.encode({"sub": "user-1"}, KEY)
+
+        self.assertMatchesPrevious(token, key="other")
+        self.assertMatchesPrevious(token, key="other", options={"verify_signature": False})
+        self.assertMatchesPrevious(token, algorithms="HS512")
+        with self.assertRaises(JWTError):
+            jwt.decode(token, "other", algorithms="HS256")
+
+    def test_options_are_not_modified(self):
+        token = jwt.encode({"sub": "user-1"}, KEY)
+        options = {"verify_sub": False, "require_sub": True}
+
+        jwt.decode(token, KEY, algorithms="HS256", options=options)
+        self.assertEqual(options, {"verify_sub": False, "require_sub": True})
+
+
+class TestClaimsValidator(unittest.TestCase):
+    def test_reused_for_many_tokens(self):
+        validate = jwt.ClaimsValidator(audience="client", issuer="issuer")
+        now = int(time.time())
+        good = jwt.encode({"aud": "client", "iss": "issuer", "exp": now + 60}, KEY)
+        expired = jwt.encode({"aud": "client", "iss": "issuer", "exp": now - 60}, KEY)
+        wrong_issuer = jwt.encode({"aud": "client", "iss": "other", "exp": now + 60}, KEY)
+
+        for _ in range(2):
+            self.assertEqual(jwt.decode(good, KEY, algorithms="HS256", claims_validator=validate)["iss"], "issuer")
+            with self.assertRaises(ExpiredSignatureError):
+                jwt.decode(expired, KEY, algorithms="HS256", claims_validator=validate)
+            with self.assertRaises(JWTClaimsError):
+                jwt.decode(wrong_issuer, KEY, algorithms="HS256", claims_validator=validate)
+
+    def test_replaces_claim_arguments(self):
+        token = jwt.encode({"aud": "client"}, KEY)
+        validate = jwt.ClaimsValidator(audience="client")
+
+        self.assertEqual(jwt.decode(token, KEY, algorithms="HS256", audience="other", claims_validator=validate),
+                         {"aud": "client"})
+
+    def test_signature_still_checked(self):
+        token = jwt.encode({"sub": "user-1"}, KEY)
+
+        with self.assertRaises(JWTError):
+            jwt.decode(token, "other", algorithms="HS256", claims_validator=jwt.ClaimsValidator())
+
+    def test_required_claim_is_verified(self):
+        validate = jwt.ClaimsValidator(options={"verify_exp": False, "require_exp": True})
+
+        with self.assertRaises(JWTError):
+            validate({})
+        with self.assertRaises(ExpiredSignatureError):
+            validate({"exp": int(time.time()) - 60})
+
+    def test_audience_must_be_a_string(self):
+        with self.assertRaises(JWTError):
+            jwt.ClaimsValidator(audience=["client"])
+
+
+class TestParsedJWT(unittest.TestCase):
+    def setUp(self):
+        self.token = jwt.encode({"sub": "user-1"}, KEY)
+        self.header, self.payload, self.signature = self.token.split(".")
+
+    def test_bad_header_fails_on_construction(self):
+        with self.assertRaises(JWTError):
+            jwt.ParsedJWT("!!!." + self.payload + "." + self.signature)
+        with self.assertRaises(JWTError):
+            jwt.ParsedJWT(self.header + "." + self.payload)
+
+    def test_bad_payload_fails_when_claims_are_read(self):
+        for payload in ("!!!", jws.base64url_encode(b"[1, 2]").decode(), jws.base64url_encode(b"{").decode()):
+            parsed = jwt.ParsedJWT(".".join([self.header, payload, self.signature]))
+
+            self.assertEqual(parsed.header["alg"], "HS256")
+            with self.assertRaises(JWTError):
+                parsed.claims
+
+    def test_bad_signature_fails_when_signature_is_used(self):
+        parsed = jwt.ParsedJWT(".".join([self.header, self.payload, "AAAAA"]))
+
+        self.assertEqual(parsed.claims, {"sub": "user-1"})
+        with self.assertRaises(JWTError):
+            parsed.signature
+        with self.assertRaises(JWTError):
+            parsed.verify_signature(KEY, algorithms="HS256")
+
+    def test_decoded_parts_are_kept(self):
+        parsed = jwt.ParsedJWT(self.token)
+
+        self.assertIs(parsed.claims, parsed.claims)
+        self.assertIs(parsed.signature, parsed.signature)
+        self.assertEqual(parsed.signing_input, (self.header + "." + self.payload).encode())
+
+    def test_decode_accepts_parsed_token(self):
+        parsed = jwt.ParsedJWT(self.token)
+
+        self.assertEqual(jwt.decode(parsed, KEY, algorithms="HS256"), {"sub": "user-1"})
+        with self.assertRaises(JWTError):
+            jwt.decode(parsed, "other", algorithms="HS256")
+
+    def test_validate_claims(self):
+        parsed = jwt.ParsedJWT(self.token)
+
+        self.assertEqual(parsed.validate_claims(subject="user-1"), {"sub": "user-1"})
+        with self.assertRaises(JWTClaimsError):
+            parsed.validate_claims(subject="user-2")
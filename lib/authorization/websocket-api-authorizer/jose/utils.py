@@ -1,5 +1,4 @@
 import base64
-import struct
 
 # Piggyback of the backends implementation of the function that converts a long
 # to a bytes stream. Some plumbing is necessary to have the signatures match.
@@ -37,7 +36,9 @@ def base64_to_long(data):
 
     # urlsafe_b64decode will happily convert b64encoded data
     _d = base64.urlsafe_b64decode(bytes(data) + b"==")
-    return int_arr_to_long(struct.unpack("%sB" % len(_d), _d))
+    if not _d:
+        raise ValueError("Cannot convert an empty value to an integer")
+    return int.from_bytes(_d, "big")
 
 
 def calculate_at_hash(access_token, hash_alg):
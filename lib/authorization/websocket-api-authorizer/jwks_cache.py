@@ -0,0 +1,236 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import urllib.request
+
+from jose import jwk
+from jose.constants import ALGORITHMS
+
+
+class JWKSCache:
+    """Process-wide JWKS registry that survives across warm invocations.
+
+    Keys are refetched once the TTL has elapsed, or once when a token names a
+    kid we have not seen (so Cognito key rotation keeps working). If the
+    endpoint is unavailable the last good key set keeps being served.
+
+    Keys are held as constructed jose key objects, built once per JWKS
+    version, so the verify path does no JSON or key parsing.
+
+    With `background` enabled the set is refreshed `refresh_ahead` seconds
+    before the TTL runs out on a daemon thread while requests keep being
+    answered from the current keys (stale-while-revalidate), so only the
+    very first fetch and kid misses are paid on the request path.
+
+    With a `snapshot_path` every successful fetch is also written there, so a
+    re-initialised execution environment that kept its /tmp can start from
+    that copy (while it is inside the TTL) instead of calling the endpoint.
+    """
+
+    def __init__(self, url, ttl=3600, min_refresh_interval=30, timeout=5, refresh_ahead=300, background=True,
+                 snapshot_path=None):
+        self.url = url
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.background = background
+        self.snapshot_path = snapshot_path
+        # Lower bound between two network fetches, so a stream of tokens with
+        # unknown kids (or an unreachable endpoint) can't turn into a fetch per request
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+
+        self._jwks = {}
+        self._keys = {}
+        self.version = 0
+        self._fetched_at = 0.0
+        self._last_attempt = 0.0
+        self._lock = threading.Lock()
+        # Held by the background refresh thread while it runs, so at most one is in flight
+        self._background_lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.background_refreshes = 0
+        self.snapshot_loads = 0
+        self.fetch_errors = 0
+
+    def get_key(self, kid):
+        """Return the public key object for `kid`, or None if the key set doesn't contain it."""
+        now = time.time()
+        if not self._keys:
+            self.misses += 1
+            # Same backoff as below: an endpoint that is down at cold start,
+            # with no snapshot, is retried every min_refresh_interval, not per request
+            if now - self._last_attempt >= self.min_refresh_interval:
+                self.refresh(now)
+        elif not self._needs_refresh(now):
+            self.hits += 1
+        elif self.background:
+            # Answer from the current set and revalidate off the request path
+            self.hits += 1
+            self._refresh_in_background()
+        else:
+            self.misses += 1
+            self.refresh(now)
+
+        key = self._keys.get(kid)
+        if key is None and now - self._last_attempt >= self.min_refresh_interval:
+            # Unknown kid: the user pool may have rotated its keys, refetch once
+            self.misses += 1
+            self.refresh(now)
+            key = self._keys.get(kid)
+        return key
+
+    def prefetch(self):
+        """Fetch the key set eagerly, e.g. during the Lambda init phase.
+
+        Nothing is fetched if a snapshot already provided keys inside the TTL.
+        """
+        if not self._keys or self._needs_refresh(time.time()):
+            self.refresh()
+        return bool(self._keys)
+
+    def load_snapshot(self):
+        """Start from the snapshot on disk if it is for this URL and still inside the TTL."""
+        if not self.snapshot_path:
+            return False
+        try:
+            with open(self.snapshot_path) as f:
+                snapshot = json.load(f)
+            fetched_at = float(snapshot['fetched_at'])
+            if snapshot['url'] != self.url or not 0 <= time.time() - fetched_at < self.ttl:
+                return False
+            jwks, constructed = self._build(snapshot['jwks']['keys'])
+            if not constructed:
+                return False
+            with self._lock:
+                self._install(jwks, constructed, fetched_at)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            print(f'Ignoring unreadable JWKS snapshot {self.snapshot_path}: {str(e)}')
+            return False
+        self.snapshot_loads += 1
+        return True
+
+    def _save_snapshot(self, keys, fetched_at):
+        directory = os.path.dirname(self.snapshot_path) or '.'
+        try:
+            # Write to a temporary file and rename it over the snapshot, so a
+            # concurrent reader never sees a half-written document
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.jwks-', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({'url': self.url, 'fetched_at': fetched_at, 'jwks': {'keys': keys}}, f)
+                os.replace(tmp_path, self.snapshot_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            print(f'Could not write JWKS snapshot {self.snapshot_path}: {str(e)}')
+
+    def refresh(self, now=None):
+        """Fetch the key set, keeping the previous one if the fetch fails.
+
+        Returns True when a new copy of the key set was loaded.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            # Another caller started a refresh after this one asked for it
+            if self._last_attempt > now:
+                return False
+            attempt = self._last_attempt = time.time()
+        # The fetch runs without the lock: Lambda freezes a background refresh
+        # between invocations, and a request that needs the keys must not wait
+        # on that frozen socket until it times out
+        try:
+            # urllib rather than requests: the key set is one small GET, and
+            # requests/urllib3/idna/charset_normalizer add a lot to cold start
+            with urllib.request.urlopen(self.url, timeout=self.timeout) as response:
+                keys = json.loads(response.read())['keys']
+        except Exception as e:
+            self.fetch_errors += 1
+            print(f'JWKS fetch failed, serving {len(self._keys)} cached keys: {str(e)}')
+            return False
+        jwks, constructed = self._build(keys)
+        with self._lock:
+            if attempt < self._fetched_at:
+                # A refresh that started later has already installed its keys
+                return False
+            self._install(jwks, constructed, attempt)
+            self.refreshes += 1
+        if self.snapshot_path and constructed:
+            self._save_snapshot(keys, attempt)
+        return True
+
+    def _build(self, keys):
+        """Index `keys` by kid and construct them, reusing keys already built for unchanged JWKs."""
+        jwks = {}
+        for key in keys:
+            if not isinstance(key, dict) or not isinstance(key.get('kid'), str):
+                print(f'Skipping JWK without a kid: {str(key)[:100]}')
+                continue
+            jwks[key['kid']] = key
+
+        current_jwks, current_keys = self._jwks, self._keys
+        if jwks == current_jwks:
+            return jwks, current_keys
+        constructed = {}
+        for kid, key in jwks.items():
+            if kid in current_keys and current_jwks[kid] == key:
+                # Unchanged across a rotation, keep the key we already built
+                constructed[kid] = current_keys[kid]
+                continue
+            try:
+                constructed[kid] = jwk.construct(key, key.get('alg', ALGORITHMS.RS256))
+            except Exception as e:
+                print(f'Skipping unusable JWK {kid}: {str(e)}')
+        return jwks, constructed
+
+    def _install(self, jwks, constructed, fetched_at):
+        # Called with self._lock held; only swaps references
+        if jwks != self._jwks:
+            self._jwks = jwks
+            self._keys = constructed
+            self.version += 1
+        self._fetched_at = fetched_at
+
+    def _refresh_in_background(self):
+        if not self._background_lock.acquire(blocking=False):
+            return
+        try:
+            threading.Thread(target=self._background_refresh, daemon=True).start()
+        except Exception:
+            self._background_lock.release()
+            raise
+
+    def _background_refresh(self):
+        try:
+            if self.refresh():
+                self.background_refreshes += 1
+        finally:
+            self._background_lock.release()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'refreshes': self.refreshes,
+            'background_refreshes': self.background_refreshes,
+            'snapshot_loads': self.snapshot_loads,
+            'fetch_errors': self.fetch_errors,
+            'keys': len(self._keys),
+            'version': self.version,
+            'age_seconds': time.time() - self._fetched_at if self._fetched_at else None,
+        }
+
+    def _needs_refresh(self, now):
+        if now - self._fetched_at < self.ttl - self.refresh_ahead:
+            return False
+        # Due for a refresh, but don't hammer an endpoint that just failed
+        return now - self._last_attempt >= self.min_refresh_interval
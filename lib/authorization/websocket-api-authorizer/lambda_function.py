@@ -1,72 +1,258 @@
-import json
-from jose import jwt, jwk
-from jose.utils import base64url_decode
-import requests
+from jose.exceptions import JWTError
 import time
 import os
+from collections import Counter
+from jwks_cache import JWKSCache
+from metrics import InvocationMetrics
+from rate_limit import DynamoDBBucketStore, InMemoryBucketStore, RateLimiter
+from token_cache import TokenCache, token_hash
+from token_checks import TokenRejected, check_shape, decode
+
+user_pool_id = os.environ.get('USER_POOL_ID')
+region = 'us-east-1'
+app_client_id = os.environ.get('APP_CLIENT_ID')
+# JWKS_URL lets the offline benchmark point the authorizer at a local stand-in
+keys_url = os.environ.get('JWKS_URL') or f'https://cognito-idp.{region}.amazonaws.com/{user_pool_id}/.well-known/jwks.json'
+issuer = f'https://cognito-idp.{region}.amazonaws.com/{user_pool_id}'
+
+# Tokens failing these cheap checks are refused before any key lookup or crypto
+MAX_TOKEN_BYTES = int(os.environ.get('MAX_TOKEN_BYTES', '8192'))
+ALLOWED_ALGS = frozenset(os.environ.get('ALLOWED_TOKEN_ALGS', 'RS256').split(','))
+
+# Lives at module scope so the key set is reused across warm invocations
+JWKS = JWKSCache(
+    keys_url,
+    ttl=int(os.environ.get('JWKS_CACHE_TTL_SECONDS', '3600')),
+    refresh_ahead=int(os.environ.get('JWKS_REFRESH_AHEAD_SECONDS', '300')),
+    background=os.environ.get('JWKS_BACKGROUND_REFRESH', 'true').lower() == 'true',
+    snapshot_path=os.environ.get('JWKS_SNAPSHOT_PATH', '/tmp/jwks-snapshot.json'),
+)
+# A re-initialised environment may still have the last key set in /tmp
+JWKS.load_snapshot()
+# Fetch during the init phase so the first $connect doesn't wait on Cognito
+if os.environ.get('JWKS_PREFETCH_ON_INIT', 'true').lower() == 'true':
+    JWKS.prefetch()
+
+# Rejections by reason since this environment started
+REJECTIONS = Counter()
+
+# Decisions for tokens we already verified, each kept until the token's own exp
+DECISIONS = TokenCache(
+    max_entries=int(os.environ.get('DECISION_CACHE_MAX_ENTRIES', '2048')),
+    enabled=os.environ.get('DECISION_CACHE_ENABLED', 'true').lower() == 'true',
+)
+
+# Tokens that recently failed verification, so a client retrying the same bad
+# token in a loop is refused without another RSA verify
+REJECTED = TokenCache(
+    max_entries=int(os.environ.get('NEGATIVE_CACHE_MAX_ENTRIES', '512')),
+    enabled=os.environ.get('NEGATIVE_CACHE_ENABLED', 'true').lower() == 'true',
+)
+NEGATIVE_CACHE_TTL = int(os.environ.get('NEGATIVE_CACHE_TTL_SECONDS', '30'))
+# Only failures that cost a key lookup or crypto are worth remembering
+NEGATIVE_CACHE_REASONS = frozenset(['bad_signature', 'expired', 'wrong_audience', 'bad_claims'])
+
+# Connections each principal (token sub) may open: RATE_LIMIT_PER_SECOND
+# sustained with bursts of RATE_LIMIT_BURST. Off (0) unless the stack sets
+# RATE_LIMIT_PER_SECOND, see lib/authorization/index.ts. With RATE_LIMIT_TABLE
+# set the buckets live in DynamoDB and hold across every execution
+# environment; otherwise each environment limits on its own.
+rate_limit_table = os.environ.get('RATE_LIMIT_TABLE')
+LIMITER = RateLimiter(
+    rate=float(os.environ.get('RATE_LIMIT_PER_SECOND', '0')),
+    burst=float(os.environ.get('RATE_LIMIT_BURST', '10')),
+    store=DynamoDBBucketStore(rate_limit_table) if rate_limit_table else InMemoryBucketStore(),
+)
+
+# How much of the API an Allow covers: 'method' (just event['methodArn']),
+# 'stage' or 'api'. A wider resource lets a cached authorizer result be reused
+# across routes/stages instead of invoking this function again.
+POLICY_RESOURCE_SCOPES = ('method', 'stage', 'api')
+POLICY_RESOURCE_SCOPE = os.environ.get('POLICY_RESOURCE_SCOPE', 'method')
+# Fail the init rather than quietly fall back to 'method' on a typo
+if POLICY_RESOURCE_SCOPE not in POLICY_RESOURCE_SCOPES:
+    raise ValueError(f'POLICY_RESOURCE_SCOPE must be one of {", ".join(POLICY_RESOURCE_SCOPES)}, '
+                     f'not {POLICY_RESOURCE_SCOPE!r}')
+
+def policy_resource(method_arn, scope=POLICY_RESOURCE_SCOPE):
+    # arn:aws:execute-api:{region}:{account}:{api-id}/{stage}/{route...}
+    api_arn, _, path = method_arn.partition('/')
+    if scope == 'api' and path:
+        return f'{api_arn}/*'
+    if scope == 'stage' and path:
+        stage = path.split('/', 1)[0]
+        return f'{api_arn}/{stage}/*'
+    return method_arn
+
+def build_policy(principal_id, role, method_arn, effect='Allow'):
+    # principalId and context only depend on the token, never on the request,
+    # so the same document stays valid for every route it is cached for.
+    # A Deny only ever covers the route that was asked for, so a throttled
+    # client isn't locked out of the whole API if the result is cached.
+    resource = policy_resource(method_arn) if effect == 'Allow' else method_arn
+    return {
+        'principalId': principal_id,
+        'context' : {"role" : role},
+        'policyDocument': {
+            'Version': '2012-10-17',
+            'Statement': [{
+                'Action': 'execute-api:Invoke',
+                'Effect': effect,
+                'Resource': resource
+            }]
+        }
+    }
 
 def lambda_handler(event, context):
-    token = event['queryStringParameters']['Authorization']
-    print(token)
-    user_pool_id = os.environ.get('USER_POOL_ID')
-    region = 'us-east-1'
-    app_client_id = os.environ.get('APP_CLIENT_ID')
-    keys_url = f'https://cognito-idp.{region}.amazonaws.com/{user_pool_id}/.well-known/jwks.json'
-    
-    # Download JWKs and transform them to a key dictionary
-    response = requests.get(keys_url)
-    keys = response.json()['keys']
-    key_dict = {key['kid']: json.dumps(key) for key in keys}
-
-    # Decode and validate the token
-    headers = jwt.get_unverified_headers(token)
-    print(key_dict)
-    print(headers)
-    key = json.loads(key_dict[headers['kid']])
-    public_key = jwk.construct(key)
-    print(public_key)
-
-    # Validate the token
+    metrics = InvocationMetrics()
+    try:
+        return authorize(event, metrics)
+    finally:
+        metrics.emit()
+
+def authorize(event, metrics):
+    token = (event.get('queryStringParameters') or {}).get('Authorization')
     try:
-        message, encoded_signature = str(token).rsplit('.', 1)
-        
-        # decode the signature
-        decoded_signature = base64url_decode(encoded_signature.encode('utf-8'))
-
-        # verify the signature
-        if not public_key.verify(message.encode("utf8"), decoded_signature):
-            print('Signature verification failed')
-            raise Exception("Failed")
-        print('Signature successfully verified')
-
-        claims = jwt.get_unverified_claims(token)
-        
-        # additionally we can verify the token expiration
-        if time.time() > claims['exp']:
-            print('Token is expired')
-            raise Exception("Expired")
-        
-        # and the Audience  (use claims['client_id'] if verifying an access token)
-        if claims['aud'] != app_client_id:
-            print('Token was not issued for this audience')
-            raise Exception("Wrong audience")
-                
-        principalId = claims['sub']
-        role = claims.get('custom:role','')
-
-        # Generate policy document
-        policy_document = {
-            'principalId': principalId,
-            'context' : {"role" : role},
-            'policyDocument': {
-                'Version': '2012-10-17',
-                'Statement': [{
-                    'Action': 'execute-api:Invoke',
-                    'Effect': 'Allow',
-                    'Resource': event['methodArn']
-                }]
-            }
-        }        
-        return policy_document
-    except Exception as e:
-        print(f'Token validation error: {str(e)}')
\ No newline at end of file
+        check_shape(token, MAX_TOKEN_BYTES)
+
+        # A reconnect with a token we already accepted costs a dictionary lookup
+        cache_key = token_hash(token)
+        decision = DECISIONS.get(cache_key)
+        if decision is not None:
+            metrics.set_property('DecisionCache', 'hit')
+            return admit(decision['principalId'], decision['role'], event['methodArn'], metrics)
+
+        reason = REJECTED.get(cache_key)
+        if reason is not None:
+            metrics.set_property('NegativeCache', 'hit')
+            raise TokenRejected(reason, f'Token was recently rejected ({reason})')
+
+        try:
+            claims = verify_token(token, metrics)
+        except TokenRejected as e:
+            if e.reason in NEGATIVE_CACHE_REASONS:
+                REJECTED.put(cache_key, e.reason, time.time() + NEGATIVE_CACHE_TTL)
+            raise
+    except TokenRejected as e:
+        REJECTIONS[e.reason] += 1
+        metrics.count(f'TokenRejected.{e.reason}')
+        print(f'Token validation error: {str(e)}')
+        return None
+
+    principalId = claims['sub']
+    role = claims.get('custom:role','')
+    DECISIONS.put(cache_key, {'principalId': principalId, 'role': role}, claims['exp'])
+
+    # Generate policy document
+    return admit(principalId, role, event['methodArn'], metrics)
+
+def admit(principal_id, role, method_arn, metrics):
+    """Policy for an authenticated principal: Allow, or Deny if it is over its connection rate."""
+    if not LIMITER.allow(principal_id):
+        metrics.count('Throttled')
+        print(f'Connection rate exceeded for {principal_id}')
+        return build_policy(principal_id, role, method_arn, effect='Deny')
+    return build_policy(principal_id, role, method_arn)
+
+def verify_token(token, metrics):
+    """Verify signature and claims of a token that passed check_shape; returns its claims."""
+    # Decode the token, refusing anything we'd never accept before looking up a key
+    with metrics.phase('HeaderParseTime'):
+        parsed = decode(token, ALLOWED_ALGS, issuer)
+    kid = parsed.header['kid']
+    with metrics.phase('JwksFetchTime'):
+        public_key = JWKS.get_key(kid)
+    if public_key is None:
+        raise TokenRejected('unknown_kid', f'No key for kid {kid}')
+
+    with metrics.phase('SignatureVerifyTime'):
+        check_signature(public_key, parsed)
+    with metrics.phase('ClaimsValidationTime'):
+        check_claims(parsed.claims)
+    return parsed.claims
+
+def check_signature(public_key, parsed):
+    # verify the signature over the raw header.payload bytes
+    try:
+        signature = parsed.signature
+    except JWTError:
+        raise TokenRejected('bad_signature', 'Undecodable signature')
+    if not public_key.verify(parsed.signing_input, signature):
+        raise TokenRejected('bad_signature', 'Signature verification failed')
+
+def check_claims(claims):
+    # additionally we can verify the token expiration
+    if not isinstance(claims.get('exp'), (int, float)) or not isinstance(claims.get('sub'), str):
+        raise TokenRejected('bad_claims', 'Token is missing exp or sub')
+    if time.time() > claims['exp']:
+        raise TokenRejected('expired', 'Token is expired')
+
+    # and the Audience  (use claims['client_id'] if verifying an access token)
+    if claims.get('aud') != app_client_id:
+        raise TokenRejected('wrong_audience', 'Token was not issued for this audience')
+
+def verify_tokens(tokens, processes=None):
+    """Verify many tokens against the cached key set, for load tests and evaluation harnesses.
+
+    Tokens are grouped by kid so each group looks its key up once; with
+    `processes` the groups are split into chunks and verified in a process
+    pool. This checks tokens only: the decision/negative caches and the rate
+    limiter are neither consulted nor updated. Returns one result per token,
+    in input order: {'allowed', 'principalId', 'reason', 'ms'}.
+    """
+    results = [None] * len(tokens)
+    groups = {}
+    for index, token in enumerate(tokens):
+        started = time.perf_counter()
+        try:
+            check_shape(token, MAX_TOKEN_BYTES)
+            parsed = decode(token, ALLOWED_ALGS, issuer)
+        except TokenRejected as e:
+            results[index] = _batch_result(time.perf_counter() - started, reason=e.reason)
+            continue
+        parse_seconds = time.perf_counter() - started
+        groups.setdefault(parsed.header['kid'], []).append((index, parsed, parse_seconds))
+
+    if processes and processes > 1 and groups:
+        from concurrent.futures import ProcessPoolExecutor
+        pending = sum(len(items) for items in groups.values())
+        chunk_size = max(1, -(-pending // (processes * 4)))
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [
+                pool.submit(_verify_group, kid, items[i:i + chunk_size])
+                for kid, items in groups.items()
+                for i in range(0, len(items), chunk_size)
+            ]
+            for future in futures:
+                for index, result in future.result():
+                    results[index] = result
+    else:
+        for kid, items in groups.items():
+            for index, result in _verify_group(kid, items):
+                results[index] = result
+    return results
+
+def _verify_group(kid, items):
+    # Module level so a process pool can pickle it; the worker's own JWKS
+    # cache (inherited on fork, or loaded at import) supplies the key
+    started = time.perf_counter()
+    public_key = JWKS.get_key(kid)
+    key_seconds = (time.perf_counter() - started) / len(items)
+    results = []
+    for index, parsed, parse_seconds in items:
+        started = time.perf_counter()
+        try:
+            if public_key is None:
+                raise TokenRejected('unknown_kid', f'No key for kid {kid}')
+            check_signature(public_key, parsed)
+            check_claims(parsed.claims)
+        except TokenRejected as e:
+            result = _batch_result(time.perf_counter() - started, reason=e.reason)
+        else:
+            result = _batch_result(time.perf_counter() - started, principal_id=parsed.claims['sub'])
+        result['ms'] += (parse_seconds + key_seconds) * 1000
+        results.append((index, result))
+    return results
+
+def _batch_result(seconds, principal_id=None, reason=None):
+    return {'allowed': reason is None, 'principalId': principal_id, 'reason': reason, 'ms': seconds * 1000}
@@ -0,0 +1,73 @@
+import json
+import os
+import random
+import time
+from contextlib import contextmanager
+
+NAMESPACE = os.environ.get('METRICS_NAMESPACE', 'ABE/WebSocketAuthorizer')
+# Fraction of invocations whose phase timings are written to the log
+SAMPLE_RATE = float(os.environ.get('METRICS_SAMPLE_RATE', '0.1'))
+
+
+class InvocationMetrics:
+    """Timings and counters for one authorizer invocation.
+
+    Written to stdout as a CloudWatch Embedded Metric Format record, which
+    CloudWatch Logs turns into metrics without any API calls. Phase timings
+    are sampled; counters (rejections, throttles, ...) are always emitted so
+    those counts stay exact.
+    """
+
+    def __init__(self, namespace=NAMESPACE, sample_rate=SAMPLE_RATE):
+        self.namespace = namespace
+        self.sample_rate = sample_rate
+        self.timings = {}
+        self.counts = {}
+        self.properties = {}
+
+    @contextmanager
+    def phase(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed
+
+    def count(self, name, value=1):
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def set_property(self, name, value):
+        self.properties[name] = value
+
+    def record(self, include_timings=True):
+        """Build the EMF document for this invocation."""
+        timings = self.timings if include_timings else {}
+        metrics = [{'Name': name, 'Unit': 'Milliseconds'} for name in timings]
+        metrics += [{'Name': name, 'Unit': 'Count'} for name in self.counts]
+        record = {
+            '_aws': {
+                'Timestamp': int(time.time() * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': self.namespace,
+                    'Dimensions': [['FunctionName']],
+                    'Metrics': metrics,
+                }],
+            },
+            'FunctionName': os.environ.get('AWS_LAMBDA_FUNCTION_NAME', 'local'),
+            'SampleRate': self.sample_rate,
+        }
+        record.update(self.properties)
+        record.update(timings)
+        record.update(self.counts)
+        return record
+
+    def emit(self):
+        # Unsampled invocations still report their counters, but not their
+        # timings, so the latency distribution isn't skewed towards them
+        sampled = bool(self.timings) and random.random() < self.sample_rate
+        if not sampled and not self.counts:
+            return None
+        record = self.record(include_timings=sampled)
+        print(json.dumps(record))
+        return record
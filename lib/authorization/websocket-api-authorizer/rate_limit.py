@@ -0,0 +1,148 @@
+import threading
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+
+
+class InMemoryBucketStore:
+    """Token buckets held in this process.
+
+    Every Lambda execution environment limits on its own, so the effective
+    limit across the fleet is roughly rate * concurrent environments. Use
+    DynamoDBBucketStore when one limit has to hold across all of them.
+    """
+
+    def __init__(self, max_principals=10000):
+        self.max_principals = max_principals
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key, rate, burst, now):
+        """Take one token from `key`'s bucket; returns False if it is empty."""
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated_at) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_principals:
+                # Dropping the least recently seen bucket only ever refills it
+                self._buckets.popitem(last=False)
+            return allowed
+
+
+class DynamoDBBucketStore:
+    """Token buckets shared by every execution environment through a DynamoDB table.
+
+    The table needs a string partition key `pk`; enable TTL on `expires_at`
+    to have idle buckets removed. Updates use optimistic concurrency on a
+    version attribute. If DynamoDB is unavailable the connection is let
+    through: the limiter protects downstream capacity, it is not an auth check.
+    """
+
+    def __init__(self, table_name, max_attempts=3, table=None):
+        if table is None:
+            import boto3
+            table = boto3.resource('dynamodb').Table(table_name)
+        self.table = table
+        self.max_attempts = max_attempts
+
+    def take(self, key, rate, burst, now):
+        # Only this store needs Decimal (boto3 rejects floats); importing
+        # _decimal at module level would cost every cold start
+        from decimal import Decimal
+
+        try:
+            for _ in range(self.max_attempts):
+                item = self.table.get_item(Key={'pk': key}, ConsistentRead=True).get('Item')
+                if item:
+                    tokens = float(item['tokens']) + (now - float(item['updated_at'])) * rate
+                    version = int(item['version'])
+                else:
+                    tokens, version = burst, 0
+                tokens = min(burst, tokens)
+                allowed = tokens >= 1
+                if allowed:
+                    tokens -= 1
+                try:
+                    self.table.put_item(
+                        Item={
+                            'pk': key,
+                            'tokens': Decimal(str(tokens)),
+                            'updated_at': Decimal(str(now)),
+                            'version': version + 1,
+                            # Long enough for an idle bucket to refill completely
+                            'expires_at': int(now + burst / rate) + 60,
+                        },
+                        ConditionExpression='attribute_not_exists(pk) OR version = :version',
+                        ExpressionAttributeValues={':version': version},
+                    )
+                    return allowed
+                except self.table.meta.client.exceptions.ConditionalCheckFailedException:
+                    # Another environment updated the bucket first, read it again
+                    continue
+        except Exception as e:
+            print(f'Rate limit store unavailable, allowing {key}: {str(e)}')
+            return True
+        print(f'Rate limit bucket for {key} kept changing underneath us, allowing')
+        return True
+
+
+class LocalTable:
+    """In-process stand-in for the DynamoDB table behind DynamoDBBucketStore.
+
+    Implements just the calls the store makes (get_item, and put_item with
+    its version condition), so the shared-store path can run in tests or
+    locally without AWS: DynamoDBBucketStore(None, table=LocalTable()).
+    """
+
+    class ConditionalCheckFailedException(Exception):
+        pass
+
+    def __init__(self):
+        self.items = {}
+        self._lock = threading.Lock()
+        exceptions = SimpleNamespace(ConditionalCheckFailedException=self.ConditionalCheckFailedException)
+        self.meta = SimpleNamespace(client=SimpleNamespace(exceptions=exceptions))
+
+    def get_item(self, Key, ConsistentRead=False):
+        item = self.items.get(Key['pk'])
+        return {'Item': dict(item)} if item else {}
+
+    def put_item(self, Item, ConditionExpression, ExpressionAttributeValues):
+        # Stands in for 'attribute_not_exists(pk) OR version = :version'
+        with self._lock:
+            current = self.items.get(Item['pk'])
+            if current and current['version'] != ExpressionAttributeValues[':version']:
+                raise self.ConditionalCheckFailedException('The conditional request failed')
+            self.items[Item['pk']] = dict(Item)
+
+
+class RateLimiter:
+    """Per-principal token bucket: `rate` connections per second with bursts of up to `burst`."""
+
+    def __init__(self, rate, burst, store=None):
+        self.rate = rate
+        self.burst = burst
+        self.store = store or InMemoryBucketStore()
+        self.allowed = 0
+        self.throttled = 0
+
+    @property
+    def enabled(self):
+        return self.rate > 0 and self.burst >= 1
+
+    def allow(self, principal, now=None):
+        if not self.enabled:
+            return True
+        now = time.time() if now is None else now
+        if self.store.take(principal, self.rate, self.burst, now):
+            self.allowed += 1
+            return True
+        self.throttled += 1
+        return False
+
+    def stats(self):
+        return {'enabled': self.enabled, 'allowed': self.allowed, 'throttled': self.throttled}
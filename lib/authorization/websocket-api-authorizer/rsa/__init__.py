@@ -27,6 +27,8 @@ from rsa.pkcs1 import (
     decrypt,
     sign,
     verify,
+    sign_file,
+    verify_file,
     DecryptionError,
     VerificationError,
     find_signature_hash,
@@ -50,6 +52,8 @@ __all__ = [
     "decrypt",
     "sign",
     "verify",
+    "sign_file",
+    "verify_file",
     "PublicKey",
     "PrivateKey",
     "DecryptionError",
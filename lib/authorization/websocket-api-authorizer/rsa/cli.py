@@ -113,6 +113,7 @@ class CryptoOperation(metaclass=abc.ABCMeta):
     )
     expected_cli_args = 1
     has_output = True
+    streams_input = False
 
     key_class = rsa.PublicKey  # type: typing.Type[rsa.key.AbstractKey]
 
@@ -139,7 +140,10 @@ class CryptoOperation(metaclass=abc.ABCMeta):
 
         key = self.read_key(cli_args[0], cli.keyform)
 
-        indata = self.read_infile(cli.input)
+        if self.streams_input:
+            indata = self.input_source(cli.input)  # type: typing.Any
+        else:
+            indata = self.read_infile(cli.input)
 
         print(self.operation_progressive.title(), file=sys.stderr)
         outdata = self.perform_operation(indata, key, cli_args)
@@ -195,6 +199,16 @@ class CryptoOperation(metaclass=abc.ABCMeta):
         print("Reading input from stdin", file=sys.stderr)
         return sys.stdin.buffer.read()
 
+    def input_source(self, inname: str) -> typing.Union[str, typing.BinaryIO]:
+        """Returns the input file name, or stdin, for operations that stream their input"""
+
+        if inname:
+            print("Streaming input from %s" % inname, file=sys.stderr)
+            return inname
+
+        print("Streaming input from stdin", file=sys.stderr)
+        return sys.stdin.buffer
+
     def write_outfile(self, outdata: bytes, outname: str) -> None:
         """Write the output file"""
 
@@ -261,6 +275,7 @@ class SignOperation(CryptoOperation):
     operation_progressive = "Signing"
     key_class = rsa.PrivateKey
     expected_cli_args = 2
+    streams_input = True
 
     output_help = (
         "Name of the file to write the signature to. Written "
@@ -268,7 +283,10 @@ class SignOperation(CryptoOperation):
     )
 
     def perform_operation(
-        self, indata: bytes, priv_key: rsa.key.AbstractKey, cli_args: Indexable
+        self,
+        indata: typing.Union[str, typing.BinaryIO],
+        priv_key: rsa.key.AbstractKey,
+        cli_args: Indexable,
     ) -> bytes:
         """Signs files."""
         assert isinstance(priv_key, rsa.key.PrivateKey)
@@ -277,6 +295,8 @@ class SignOperation(CryptoOperation):
         if hash_method not in HASH_METHODS:
             raise SystemExit("Invalid hash method, choose one of %s" % ", ".join(HASH_METHODS))
 
+        if isinstance(indata, str):
+            return rsa.sign_file(indata, priv_key, hash_method)
         return rsa.sign(indata, priv_key, hash_method)
 
 
@@ -295,9 +315,13 @@ class VerifyOperation(CryptoOperation):
     key_class = rsa.PublicKey
     expected_cli_args = 2
     has_output = False
+    streams_input = True
 
     def perform_operation(
-        self, indata: bytes, pub_key: rsa.key.AbstractKey, cli_args: Indexable
+        self,
+        indata: typing.Union[str, typing.BinaryIO],
+        pub_key: rsa.key.AbstractKey,
+        cli_args: Indexable,
     ) -> None:
         """Verifies files."""
         assert isinstance(pub_key, rsa.key.PublicKey)
@@ -308,7 +332,10 @@ class VerifyOperation(CryptoOperation):
             signature = sigfile.read()
 
         try:
-            rsa.verify(indata, signature, pub_key)
+            if isinstance(indata, str):
+                rsa.verify_file(indata, signature, pub_key)
+            else:
+                rsa.verify(indata, signature, pub_key)
         except rsa.VerificationError as ex:
             raise SystemExit("Verification failed.") from ex
 
@@ -31,6 +31,7 @@ of pyasn1.
 
 """
 
+import collections
 import threading
 import typing
 import warnings
@@ -51,7 +52,7 @@ T = typing.TypeVar("T", bound="AbstractKey")
 class AbstractKey:
     """Abstract superclass for private and public keys."""
 
-    __slots__ = ("n", "e", "blindfac", "blindfac_inverse", "mutex")
+    __slots__ = ("n", "e", "blindfac", "blindfac_inverse", "mutex", "blinding_pool")
 
     def __init__(self, n: int, e: int) -> None:
         self.n = n
@@ -64,6 +65,9 @@ class AbstractKey:
         # environments.
         self.mutex = threading.Lock()
 
+        # Precomputed blinding factors, see use_blinding_pool().
+        self.blinding_pool = None  # type: typing.Optional[BlindingPool]
+
     @classmethod
     def _load_pkcs1_pem(cls: typing.Type[T], keyfile: bytes) -> T:
         """Loads a key in PKCS#1 PEM format, implement in a subclass.
@@ -166,10 +170,41 @@ class AbstractKey:
 
         See https://en.wikipedia.org/wiki/Blinding_%28cryptography%29
         """
-        blindfac, blindfac_inverse = self._update_blinding_factor()
-        blinded = (message * pow(blindfac, self.e, self.n)) % self.n
+        if self.blinding_pool is not None:
+            blindfac_e, blindfac_inverse = self.blinding_pool.take()
+        else:
+            blindfac, blindfac_inverse = self._update_blinding_factor()
+            blindfac_e = pow(blindfac, self.e, self.n)
+        blinded = (message * blindfac_e) % self.n
         return blinded, blindfac_inverse
 
+    def use_blinding_pool(self, size: int = 64, background: bool = False) -> "BlindingPool":
+        """Takes blinding factors from a pool computed ahead of time.
+
+        Without a pool every private-key operation derives its blinding
+        factor under :py:attr:`mutex` and raises it to ``e``. With one, it
+        takes a ready ``(r^e, r^-1)`` pair instead, so concurrent signers no
+        longer queue on the lock.
+
+        :param size: number of pairs to keep ready.
+        :param background: refill the pool on a daemon thread whenever it
+            runs low, instead of inline when it runs out.
+        :return: the new pool, also available as :py:attr:`blinding_pool`.
+
+        >>> pk = PrivateKey(3727264081, 65537, 3349121513, 65063, 57287)
+        >>> pool = pk.use_blinding_pool(size=8)
+        >>> len(pool)
+        8
+        >>> pk.blinded_encrypt(42) == pow(42, pk.d, pk.n)
+        True
+        >>> len(pool)
+        7
+        """
+        if self.blinding_pool is not None:
+            self.blinding_pool.close()
+        self.blinding_pool = BlindingPool(self, size, background)
+        return self.blinding_pool
+
     def unblind(self, blinded: int, blindfac_inverse: int) -> int:
         """Performs blinding on the message using random number 'blindfac_inverse'.
 
@@ -215,6 +250,86 @@ class AbstractKey:
             return self.blindfac, self.blindfac_inverse
 
 
+class BlindingPool:
+    """Blinding factors for one key, computed ahead of time.
+
+    Hands out ``(r^e mod n, r^-1 mod n)`` pairs. Each fill starts from a fresh
+    random ``r`` (one modular inverse) and derives the rest of the batch by
+    squaring, the same update :py:meth:`AbstractKey._update_blinding_factor`
+    uses between operations. Pairs are handed out from a deque, which needs
+    no lock; only refills are serialised.
+
+    A background refill thread keeps a reference to the pool and its key
+    until :py:meth:`close` is called.
+    """
+
+    def __init__(self, key: AbstractKey, size: int = 64, background: bool = False) -> None:
+        if size < 1:
+            raise ValueError("Blinding pool size must be at least 1, not %i" % size)
+        self.key = key
+        self.size = size
+        self.low_water = max(1, size // 4)
+        self._pairs = collections.deque()  # type: typing.Deque[typing.Tuple[int, int]]
+        self._fill_lock = threading.Lock()
+        self._wanted = threading.Event()
+        self._closed = False
+        self._thread = None  # type: typing.Optional[threading.Thread]
+
+        self.fill()
+        if background:
+            self._thread = threading.Thread(target=self._refill_forever, name="rsa-blinding-pool", daemon=True)
+            self._thread.start()
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def take(self) -> typing.Tuple[int, int]:
+        """Returns a ``(r^e mod n, r^-1 mod n)`` pair that is never handed out again."""
+        while True:
+            try:
+                pair = self._pairs.popleft()
+                break
+            except IndexError:
+                # Ran dry: fill inline rather than wait for the background thread
+                self.fill()
+
+        if self._thread is not None and len(self._pairs) < self.low_water:
+            self._wanted.set()
+        return pair
+
+    def fill(self) -> None:
+        """Tops the pool up to :py:attr:`size` pairs."""
+        with self._fill_lock:
+            missing = self.size - len(self._pairs)
+            if missing <= 0:
+                return
+
+            n = self.key.n
+            blindfac = self.key._initial_blinding_factor()
+            blindfac_e = pow(blindfac, self.key.e, n)
+            blindfac_inverse = rsa.common.inverse(blindfac, n)
+            pairs = []
+            for _ in range(missing):
+                pairs.append((blindfac_e, blindfac_inverse))
+                # (r^2)^e = (r^e)^2, so the next pair is two squarings away
+                blindfac_e = pow(blindfac_e, 2, n)
+                blindfac_inverse = pow(blindfac_inverse, 2, n)
+            self._pairs.extend(pairs)
+
+    def close(self) -> None:
+        """Stops the background refill thread, if there is one."""
+        self._closed = True
+        self._wanted.set()
+
+    def _refill_forever(self) -> None:
+        while True:
+            self._wanted.wait()
+            self._wanted.clear()
+            if self._closed:
+                return
+            self.fill()
+
+
 class PublicKey(AbstractKey):
     """Represents a public RSA key.
 
@@ -462,6 +577,24 @@ class PrivateKey(AbstractKey):
     def __hash__(self) -> int:
         return hash((self.n, self.e, self.d, self.p, self.q, self.exp1, self.exp2, self.coef))
 
+    def _exponentiate(self, blinded: int) -> int:
+        """Raises ``blinded`` to the private exponent, modulo n.
+
+        Instead of using the core functionality, use the Chinese Remainder
+        Theorem: two half-size exponentiations modulo p and q, recombined
+        with coef, are 3-4x faster than one with d modulo n. This is the
+        same as ``rsa.core.decrypt_int(blinded, self.d, self.n)``:
+
+        >>> pk = PrivateKey(3727264081, 65537, 3349121513, 65063, 57287)
+        >>> all(pk._exponentiate(x) == pow(x, pk.d, pk.n) for x in (0, 1, 42, 65063, 3727264080))
+        True
+        """
+
+        s1 = pow(blinded, self.exp1, self.p)
+        s2 = pow(blinded, self.exp2, self.q)
+        h = ((s1 - s2) * self.coef) % self.p
+        return s2 + self.q * h
+
     def blinded_decrypt(self, encrypted: int) -> int:
         """Decrypts the message using blinding to prevent side-channel attacks.
 
@@ -474,21 +607,19 @@ class PrivateKey(AbstractKey):
 
         # Blinding and un-blinding should be using the same factor
         blinded, blindfac_inverse = self.blind(encrypted)
-
-        # Instead of using the core functionality, use the Chinese Remainder
-        # Theorem and be 2-4x faster. This the same as:
-        #
-        # decrypted = rsa.core.decrypt_int(blinded, self.d, self.n)
-        s1 = pow(blinded, self.exp1, self.p)
-        s2 = pow(blinded, self.exp2, self.q)
-        h = ((s1 - s2) * self.coef) % self.p
-        decrypted = s2 + self.q * h
-
+        decrypted = self._exponentiate(blinded)
         return self.unblind(decrypted, blindfac_inverse)
 
     def blinded_encrypt(self, message: int) -> int:
         """Encrypts the message using blinding to prevent side-channel attacks.
 
+        This is the private-key operation used for signing; it gives exactly
+        the result of ``rsa.core.encrypt_int(message, self.d, self.n)``:
+
+        >>> pk = PrivateKey(3727264081, 65537, 3349121513, 65063, 57287)
+        >>> pk.blinded_encrypt(42) == rsa.core.encrypt_int(42, pk.d, pk.n)
+        True
+
         :param message: the message to encrypt
         :type message: int
 
@@ -497,7 +628,7 @@ class PrivateKey(AbstractKey):
         """
 
         blinded, blindfac_inverse = self.blind(message)
-        encrypted = rsa.core.encrypt_int(blinded, self.d, self.n)
+        encrypted = self._exponentiate(blinded)
         return self.unblind(encrypted, blindfac_inverse)
 
     @classmethod
@@ -22,27 +22,133 @@ Introduced in Python-RSA 3.1.
 
 """
 
+import atexit
 import multiprocessing as mp
+import threading
+import typing
 from multiprocessing.connection import Connection
 
 import rsa.prime
 import rsa.randnum
 
 
-def _find_prime(nbits: int, pipe: Connection) -> None:
+def _prime_worker(requests: Connection, results: typing.Any, current_search: typing.Any) -> None:
+    # Searches for each requested prime until it finds one or the search it
+    # belongs to is over (another worker found one first).
     while True:
-        integer = rsa.randnum.read_random_odd_int(nbits)
-
-        # Test for primeness
-        if rsa.prime.is_prime(integer):
-            pipe.send(integer)
+        request = requests.recv()
+        if request is None:
             return
+        search, nbits = request
+        while current_search.value == search:
+            integer = rsa.randnum.read_random_odd_int(nbits)
+            if rsa.prime.is_prime(integer):
+                results.put((search, integer))
+                break
+
+
+class PrimePool:
+    """Worker processes that stay alive between prime searches.
+
+    Every worker searches for the same prime and the first one found is
+    returned, like :py:func:`getprime` always did, but the processes are
+    started once instead of for every prime. Use :py:func:`get_pool` to
+    share one pool per size across callers.
+
+    >>> pool = PrimePool(2)
+    >>> p = pool.getprime(128)
+    >>> rsa.prime.is_prime(p)
+    True
+    >>> pool.close()
+    """
+
+    def __init__(self, poolsize: int) -> None:
+        if poolsize < 1:
+            raise ValueError("Pool size (%i) should be >= 1" % poolsize)
+        self.poolsize = poolsize
+        self._lock = threading.Lock()
+        self._current_search = mp.RawValue("q", 0)
+        self._results = mp.Queue()
+        self._requests = []  # type: typing.List[Connection]
+        self._procs = []  # type: typing.List[mp.Process]
+        for _ in range(poolsize):
+            (request_recv, request_send) = mp.Pipe(duplex=False)
+            proc = mp.Process(
+                target=_prime_worker,
+                args=(request_recv, self._results, self._current_search),
+                daemon=True,
+            )
+            proc.start()
+            request_recv.close()
+            self._requests.append(request_send)
+            self._procs.append(proc)
+
+    def getprime(self, nbits: int) -> int:
+        """Returns a prime number that can be stored in 'nbits' bits."""
+
+        with self._lock:
+            # Odd values mark a running search, even values mean idle
+            search = self._current_search.value + 1
+            self._current_search.value = search
+            for request in self._requests:
+                request.send((search, nbits))
+            try:
+                while True:
+                    (found_in, integer) = self._results.get()
+                    # Skip primes a worker found just as an earlier search ended
+                    if found_in == search:
+                        return integer
+            finally:
+                self._current_search.value = search + 1
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+
+        with self._lock:
+            for request in self._requests:
+                try:
+                    request.send(None)
+                    request.close()
+                except OSError:
+                    pass
+            for proc in self._procs:
+                proc.join(timeout=1)
+                if proc.is_alive():
+                    proc.terminate()
+            self._requests, self._procs = [], []
+            self._results.close()
+
+
+_pools = {}  # type: typing.Dict[int, PrimePool]
+_pools_lock = threading.Lock()
+
+
+def get_pool(poolsize: int) -> PrimePool:
+    """Returns the shared :py:class:`PrimePool` of ``poolsize`` workers, starting it if needed."""
+
+    with _pools_lock:
+        pool = _pools.get(poolsize)
+        if pool is None:
+            pool = _pools[poolsize] = PrimePool(poolsize)
+        return pool
+
+
+@atexit.register
+def close_pools() -> None:
+    """Stops every pool started by :py:func:`get_pool`."""
+
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
 
 
 def getprime(nbits: int, poolsize: int) -> int:
     """Returns a prime number that can be stored in 'nbits' bits.
 
-    Works in multiple threads at the same time.
+    Works in multiple processes at the same time. The processes belong to the
+    shared pool for ``poolsize`` and are reused by later calls, e.g. for the
+    second prime of a key or the next :py:func:`rsa.newkeys` call.
 
     >>> p = getprime(128, 3)
     >>> rsa.prime.is_prime(p-1)
@@ -58,28 +164,10 @@ def getprime(nbits: int, poolsize: int) -> int:
 
     """
 
-    (pipe_recv, pipe_send) = mp.Pipe(duplex=False)
-
-    # Create processes
-    try:
-        procs = [mp.Process(target=_find_prime, args=(nbits, pipe_send)) for _ in range(poolsize)]
-        # Start processes
-        for p in procs:
-            p.start()
-
-        result = pipe_recv.recv()
-    finally:
-        pipe_recv.close()
-        pipe_send.close()
-
-    # Terminate processes
-    for p in procs:
-        p.terminate()
-
-    return result
+    return get_pool(poolsize).getprime(nbits)
 
 
-__all__ = ["getprime"]
+__all__ = ["getprime", "get_pool", "PrimePool"]
 
 if __name__ == "__main__":
     print("Running doctests 1000x or until failure")
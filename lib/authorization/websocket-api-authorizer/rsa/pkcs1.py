@@ -27,7 +27,9 @@ to your users.
 """
 
 import hashlib
+import mmap
 import os
+import stat
 import sys
 import typing
 from hmac import compare_digest
@@ -59,6 +61,9 @@ HASH_METHODS: typing.Dict[str, typing.Callable[[], HashType]] = {
 }
 """Hash methods supported by this library."""
 
+HASH_BUFFER_SIZE = 1024 * 1024
+"""Bytes read per call when hashing file-like objects."""
+
 
 if sys.version_info >= (3, 6):
     # Python 3.6 introduced SHA3 support.
@@ -354,6 +359,54 @@ def verify(message: bytes, signature: bytes, pub_key: key.PublicKey) -> str:
 
     """
 
+    return _verify(lambda method_name: compute_hash(message, method_name), signature, pub_key)
+
+
+def sign_file(filename: str, priv_key: key.PrivateKey, hash_method: str) -> bytes:
+    """Signs the contents of a file with the private key.
+
+    Like :py:func:`sign`, but the file is hashed by :py:func:`compute_file_hash`
+    without reading it into memory first.
+
+    :param filename: path of the file to sign.
+    :param priv_key: the :py:class:`rsa.PrivateKey` to sign with
+    :param hash_method: the hash method used on the file, see :py:func:`sign`.
+    :return: a message signature block.
+    :raise OverflowError: if the private key is too small to contain the
+        requested hash.
+
+    """
+
+    return sign_hash(compute_file_hash(filename, hash_method), priv_key, hash_method)
+
+
+def verify_file(filename: str, signature: bytes, pub_key: key.PublicKey) -> str:
+    """Verifies that the signature matches the contents of a file.
+
+    Like :py:func:`verify`, but the file is hashed by :py:func:`compute_file_hash`
+    without reading it into memory first.
+
+    :param filename: path of the signed file.
+    :param signature: the signature block, as created with :py:func:`sign_file`
+        or :py:func:`rsa.sign`.
+    :param pub_key: the :py:class:`rsa.PublicKey` of the person signing the file.
+    :raise VerificationError: when the signature doesn't match the file.
+    :returns: the name of the used hash.
+
+    """
+
+    return _verify(lambda method_name: compute_file_hash(filename, method_name), signature, pub_key)
+
+
+def _verify(
+    hash_message: typing.Callable[[str], bytes], signature: bytes, pub_key: key.PublicKey
+) -> str:
+    """Verifies a signature over the message that ``hash_message`` hashes.
+
+    :param hash_message: called with the hash method found in the signature,
+        returns the digest of the signed message.
+    """
+
     keylength = common.byte_size(pub_key.n)
     encrypted = transform.bytes2int(signature)
     decrypted = core.decrypt_int(encrypted, pub_key.e, pub_key.n)
@@ -361,7 +414,7 @@ def verify(message: bytes, signature: bytes, pub_key: key.PublicKey) -> str:
 
     # Get the hash method
     method_name = _find_method_hash(clearsig)
-    message_hash = compute_hash(message, method_name)
+    message_hash = hash_message(method_name)
 
     # Reconstruct the expected padded hash
     cleartext = HASH_ASN1[method_name] + message_hash
@@ -396,6 +449,105 @@ def find_signature_hash(signature: bytes, pub_key: key.PublicKey) -> str:
     return _find_method_hash(clearsig)
 
 
+class Verifier:
+    """Verifies PKCS#1 v1.5 signatures made with one public key.
+
+    Everything :py:func:`verify` works out per call that only depends on the
+    key is done once here: the key length, and for each accepted hash the
+    padded block up to the digest (``00 01 FF..FF 00 ASN1``). Verifying then
+    costs the RSA public operation, a prefix comparison, hashing the message
+    and a constant-time digest comparison.
+
+    Signatures whose integer value isn't smaller than ``n`` are rejected, as
+    RFC 8017 section 8.2.2 requires.
+
+    >>> (pub_key, priv_key) = key.newkeys(512)
+    >>> verifier = Verifier(pub_key, ['SHA-256'])
+    >>> signature = sign(b'hello', priv_key, 'SHA-256')
+    >>> verifier.verify(b'hello', signature)
+    'SHA-256'
+    >>> verifier.verify_many([b'hello', b'world'], [signature, signature])
+    [True, False]
+    >>> verifier.verify(b'hello', sign(b'hello', priv_key, 'SHA-1'))
+    Traceback (most recent call last):
+    ...
+    rsa.pkcs1.VerificationError: Verification failed
+    """
+
+    def __init__(
+        self,
+        pub_key: key.AbstractKey,
+        hash_methods: typing.Optional[typing.Iterable[str]] = None,
+    ) -> None:
+        """
+        :param pub_key: the :py:class:`rsa.PublicKey` of the signer.
+        :param hash_methods: the hash methods to accept, by default all of
+            :py:const:`HASH_ASN1`. Hashes too large for the key are left out.
+        """
+
+        self.pub_key = pub_key
+        self.keylength = common.byte_size(pub_key.n)
+        self._expected = []  # type: typing.List[typing.Tuple[bytes, str, int]]
+
+        for method_name in HASH_ASN1 if hash_methods is None else hash_methods:
+            if method_name not in HASH_ASN1:
+                raise ValueError("Invalid hash method: %s" % method_name)
+            digest_size = HASH_METHODS[method_name]().digest_size
+            try:
+                padded = _pad_for_signing(HASH_ASN1[method_name] + bytes(digest_size), self.keylength)
+            except OverflowError:
+                continue
+            self._expected.append((padded[:-digest_size], method_name, digest_size))
+
+        if not self._expected:
+            raise ValueError("None of the hash methods fit a %i-byte key" % self.keylength)
+
+    def verify(self, message: typing.Union[bytes, typing.BinaryIO], signature: bytes) -> str:
+        """Verifies that the signature matches the message.
+
+        :param message: the signed message, as for :py:func:`verify`.
+        :param signature: the signature block, as created with :py:func:`rsa.sign`.
+        :raise VerificationError: when the signature doesn't match the message.
+        :returns: the name of the used hash.
+        """
+
+        if len(signature) != self.keylength:
+            raise VerificationError("Verification failed")
+        encrypted = transform.bytes2int(signature)
+        if encrypted >= self.pub_key.n:
+            raise VerificationError("Verification failed")
+        clearsig = transform.int2bytes(pow(encrypted, self.pub_key.e, self.pub_key.n), self.keylength)
+
+        for prefix, method_name, digest_size in self._expected:
+            if clearsig.startswith(prefix):
+                message_hash = compute_hash(message, method_name)
+                if compare_digest(clearsig[-digest_size:], message_hash):
+                    return method_name
+                break
+
+        raise VerificationError("Verification failed")
+
+    def verify_many(
+        self,
+        messages: typing.Iterable[typing.Union[bytes, typing.BinaryIO]],
+        signatures: typing.Iterable[bytes],
+    ) -> typing.List[bool]:
+        """Verifies pairs of messages and signatures.
+
+        :returns: one boolean per pair, True where the signature matches.
+        """
+
+        results = []
+        for message, signature in zip(messages, signatures):
+            try:
+                self.verify(message, signature)
+            except VerificationError:
+                results.append(False)
+            else:
+                results.append(True)
+        return results
+
+
 def yield_fixedblocks(infile: typing.BinaryIO, blocksize: int) -> typing.Iterator[bytes]:
     """Generator, yields each block of ``blocksize`` bytes in the input file.
 
@@ -434,17 +586,77 @@ def compute_hash(message: typing.Union[bytes, typing.BinaryIO], method_name: str
     method = HASH_METHODS[method_name]
     hasher = method()
 
-    if isinstance(message, bytes):
+    if isinstance(message, (bytes, bytearray, memoryview)):
         hasher.update(message)
     else:
         assert hasattr(message, "read") and hasattr(message.read, "__call__")
-        # read as 1K blocks
-        for block in yield_fixedblocks(message, 1024):
-            hasher.update(block)
+        _hash_stream(hasher, message)
+
+    return hasher.digest()
+
+
+def compute_file_hash(filename: str, method_name: str) -> bytes:
+    """Returns the digest of a file's contents.
+
+    Regular files are memory-mapped and hashed in one call, which hashlib
+    does without holding the GIL. Anything that can't be mapped (empty
+    files, pipes, devices) is streamed like a file-like ``message`` in
+    :py:func:`compute_hash`.
+
+    >>> import tempfile
+    >>> with tempfile.NamedTemporaryFile() as tmp:
+    ...     _ = tmp.write(b'hello')
+    ...     tmp.flush()
+    ...     compute_file_hash(tmp.name, 'SHA-256') == compute_hash(b'hello', 'SHA-256')
+    True
+
+    :param filename: path of the file to hash.
+    :param method_name: the hash method, must be a key of
+        :py:const:`rsa.pkcs1.HASH_METHODS`.
+
+    """
+
+    if method_name not in HASH_METHODS:
+        raise ValueError("Invalid hash method: %s" % method_name)
+
+    hasher = HASH_METHODS[method_name]()
+
+    with open(filename, "rb") as infile:
+        info = os.fstat(infile.fileno())
+        if stat.S_ISREG(info.st_mode) and info.st_size > 0:
+            try:
+                mapped = mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass
+            else:
+                with mapped:
+                    hasher.update(mapped)
+                return hasher.digest()
+        _hash_stream(hasher, infile)
 
     return hasher.digest()
 
 
+def _hash_stream(hasher: HashType, infile: typing.BinaryIO) -> None:
+    """Feeds everything left in ``infile`` to ``hasher``.
+
+    Reads into one reused buffer of :py:const:`HASH_BUFFER_SIZE` bytes when
+    the file supports ``readinto()``, so no block is copied on the way.
+    """
+
+    if not hasattr(infile, "readinto"):
+        for block in yield_fixedblocks(infile, HASH_BUFFER_SIZE):
+            hasher.update(block)
+        return
+
+    view = memoryview(bytearray(HASH_BUFFER_SIZE))
+    while True:
+        read_bytes = infile.readinto(view)
+        if not read_bytes:
+            break
+        hasher.update(view[:read_bytes])
+
+
 def _find_method_hash(clearsig: bytes) -> str:
     """Finds the hash method.
 
@@ -465,6 +677,9 @@ __all__ = [
     "decrypt",
     "sign",
     "verify",
+    "sign_file",
+    "verify_file",
+    "Verifier",
     "DecryptionError",
     "VerificationError",
     "CryptoError",
@@ -18,12 +18,38 @@ Implementation based on the book Algorithm Design by Michael T. Goodrich and
 Roberto Tamassia, 2002.
 """
 
+import math
+import typing
+
 import rsa.common
 import rsa.randnum
 
 __all__ = ["getprime", "are_relatively_prime"]
 
 
+def _sieve(limit: int) -> typing.List[int]:
+    """Returns the primes below ``limit``, by the sieve of Eratosthenes.
+
+    >>> _sieve(30)
+    [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    """
+
+    composite = bytearray(limit)
+    primes = []
+    for candidate in range(2, limit):
+        if not composite[candidate]:
+            primes.append(candidate)
+            composite[candidate * candidate :: candidate] = b"\x01" * len(range(candidate * candidate, limit, candidate))
+    return primes
+
+
+# Trial division by these rules out about 85% of random odd candidates before
+# any Miller-Rabin round. Dividing by all of them is one gcd with their product.
+SMALL_PRIME_LIMIT = 2000
+SMALL_PRIMES = frozenset(_sieve(SMALL_PRIME_LIMIT))
+_SMALL_PRIMES_PRODUCT = math.prod(SMALL_PRIMES)
+
+
 def gcd(p: int, q: int) -> int:
     """Returns the greatest common divisor of p and q
 
@@ -127,11 +153,11 @@ def is_prime(number: int) -> bool:
     """
 
     # Check for small numbers.
-    if number < 10:
-        return number in {2, 3, 5, 7}
+    if number < SMALL_PRIME_LIMIT:
+        return number in SMALL_PRIMES
 
-    # Check for even numbers.
-    if not (number & 1):
+    # Check for multiples of small primes, which includes even numbers.
+    if math.gcd(number, _SMALL_PRIMES_PRODUCT) != 1:
         return False
 
     # Calculate minimum number of rounds.
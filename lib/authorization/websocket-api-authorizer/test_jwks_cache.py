@@ -0,0 +1,227 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import rsa
+
+from jose.backends.rsa_backend import RSAKey
+from jwks_cache import JWKSCache
+
+URL = 'https://cognito-idp.example.com/pool/.well-known/jwks.json'
+
+
+def public_jwk(kid):
+    _, private = rsa.newkeys(1024)
+    key = RSAKey(private.save_pkcs1().decode(), 'RS256').public_key().to_dict()
+    key['kid'] = kid
+    return key
+
+
+class FakeEndpoint:
+    """Stands in for urlopen: serves `keys`, or raises `error` when it is set."""
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.error = None
+        self.calls = 0
+
+    def __call__(self, url, timeout=None):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        response = mock.MagicMock()
+        response.__enter__.return_value.read.return_value = json.dumps({'keys': self.keys}).encode()
+        return response
+
+
+class TestJWKSCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.k1 = public_jwk('k1')
+        cls.k2 = public_jwk('k2')
+
+    def setUp(self):
+        self.endpoint = FakeEndpoint([self.k1])
+        self.now = 1000000.0
+        patches = [
+            mock.patch('jwks_cache.urllib.request.urlopen', self.endpoint),
+            mock.patch('jwks_cache.time.time', lambda: self.now),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def cache(self, **options):
+        options.setdefault('background', False)
+        return JWKSCache(URL, ttl=3600, min_refresh_interval=30, refresh_ahead=300, **options)
+
+    def test_first_lookup_fetches_then_hits(self):
+        cache = self.cache()
+
+        self.assertIsNotNone(cache.get_key('k1'))
+        self.assertIsNotNone(cache.get_key('k1'))
+        self.assertEqual(self.endpoint.calls, 1)
+        self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_refetched_after_ttl(self):
+        cache = self.cache()
+        cache.get_key('k1')
+
+        self.now += 3600 - 300 - 1
+        cache.get_key('k1')
+        self.assertEqual(self.endpoint.calls, 1)
+
+        self.now += 2
+        cache.get_key('k1')
+        self.assertEqual(self.endpoint.calls, 2)
+
+    def test_unknown_kid_refetches_once_per_interval(self):
+        cache = self.cache()
+        cache.get_key('k1')
+        self.now += 30
+        self.endpoint.keys = [self.k1, self.k2]
+
+        self.assertIsNotNone(cache.get_key('k2'))
+        self.assertIsNone(cache.get_key('k3'))
+        self.assertEqual(self.endpoint.calls, 2)
+
+        self.now += 30
+        self.assertIsNone(cache.get_key('k3'))
+        self.assertEqual(self.endpoint.calls, 3)
+
+    def test_stale_keys_served_when_endpoint_fails(self):
+        cache = self.cache()
+        cache.get_key('k1')
+        self.endpoint.error = OSError('unreachable')
+
+        self.now += 3600
+        self.assertIsNotNone(cache.get_key('k1'))
+        self.assertEqual(cache.stats()['fetch_errors'], 1)
+
+    def test_unreachable_endpoint_at_cold_start_is_not_fetched_per_request(self):
+        self.endpoint.error = OSError('unreachable')
+        cache = self.cache()
+
+        for _ in range(5):
+            self.assertIsNone(cache.get_key('k1'))
+        self.assertEqual(self.endpoint.calls, 1)
+
+        self.now += 30
+        self.endpoint.error = None
+        self.assertIsNotNone(cache.get_key('k1'))
+        self.assertEqual(self.endpoint.calls, 2)
+
+    def test_jwk_without_kid_is_skipped(self):
+        no_kid = dict(self.k2)
+        del no_kid['kid']
+        self.endpoint.keys = [no_kid, dict(self.k2, kid=['k2']), self.k1]
+        cache = self.cache()
+
+        self.assertIsNotNone(cache.get_key('k1'))
+        self.assertEqual(cache.stats()['keys'], 1)
+
+    def test_unchanged_keys_are_not_rebuilt(self):
+        cache = self.cache()
+        key = cache.get_key('k1')
+        self.now += 30
+        self.endpoint.keys = [self.k1, self.k2]
+
+        self.assertIsNotNone(cache.get_key('k2'))
+        self.assertIs(cache.get_key('k1'), key)
+
+
+class BlockingEndpoint(FakeEndpoint):
+    """The first fetch hangs until `release` is set, like a socket frozen with the Lambda."""
+
+    def __init__(self, keys):
+        super().__init__(keys)
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.first_keys = keys
+
+    def __call__(self, url, timeout=None):
+        if self.calls == 0:
+            self.calls += 1
+            self.started.set()
+            self.release.wait(10)
+            response = mock.MagicMock()
+            response.__enter__.return_value.read.return_value = json.dumps({'keys': self.first_keys}).encode()
+            return response
+        return super().__call__(url, timeout)
+
+
+class TestJWKSRefreshConcurrency(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.k1 = public_jwk('k1')
+        cls.k2 = public_jwk('k2')
+
+    def test_request_refresh_does_not_wait_for_a_stuck_fetch(self):
+        endpoint = BlockingEndpoint([self.k1])
+        cache = JWKSCache(URL, background=False, min_refresh_interval=0)
+        with mock.patch('jwks_cache.urllib.request.urlopen', endpoint):
+            stuck = threading.Thread(target=cache.refresh)
+            stuck.start()
+            self.assertTrue(endpoint.started.wait(5))
+            endpoint.keys = [self.k1, self.k2]
+
+            started = time.perf_counter()
+            self.assertIsNotNone(cache.get_key('k2'))
+            self.assertLess(time.perf_counter() - started, 1)
+
+            # The stuck fetch finishing later must not bring back its older key set
+            endpoint.release.set()
+            stuck.join(5)
+        self.assertIsNotNone(cache.get_key('k2'))
+        self.assertEqual(cache.stats()['refreshes'], 1)
+
+
+class TestJWKSSnapshot(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.k1 = public_jwk('k1')
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, 'jwks.json')
+        self.endpoint = FakeEndpoint([self.k1])
+        patch = mock.patch('jwks_cache.urllib.request.urlopen', self.endpoint)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def write_snapshot(self, **changes):
+        snapshot = {'url': URL, 'fetched_at': 0, 'jwks': {'keys': [self.k1]}}
+        snapshot.update(changes)
+        with open(self.path, 'w') as f:
+            json.dump(snapshot, f)
+
+    def test_fetch_writes_snapshot_that_a_new_cache_loads(self):
+        JWKSCache(URL, background=False, snapshot_path=self.path).prefetch()
+
+        cache = JWKSCache(URL, background=False, snapshot_path=self.path)
+        self.assertTrue(cache.load_snapshot())
+        self.assertTrue(cache.prefetch())
+        self.assertIsNotNone(cache.get_key('k1'))
+        self.assertEqual(self.endpoint.calls, 1)
+
+    def test_expired_snapshot_is_ignored(self):
+        self.write_snapshot(fetched_at=1)
+
+        self.assertFalse(JWKSCache(URL, snapshot_path=self.path).load_snapshot())
+
+    def test_snapshot_for_other_url_is_ignored(self):
+        self.write_snapshot(url='https://other.example.com/jwks.json', fetched_at=time.time())
+
+        self.assertFalse(JWKSCache(URL, snapshot_path=self.path).load_snapshot())
+
+    def test_corrupt_snapshot_is_ignored(self):
+        with open(self.path, 'w') as f:
+            f.write('{not json')
+
+        self.assertFalse(JWKSCache(URL, snapshot_path=self.path).load_snapshot())
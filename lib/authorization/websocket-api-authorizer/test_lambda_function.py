@@ -0,0 +1,111 @@
+import importlib.util
+import os
+import unittest
+from unittest import mock
+
+# The handler module reads its configuration and touches the JWKS at import
+os.environ.setdefault('USER_POOL_ID', 'us-east-1_TEST')
+os.environ.setdefault('APP_CLIENT_ID', 'client')
+os.environ['JWKS_PREFETCH_ON_INIT'] = 'false'
+os.environ['JWKS_SNAPSHOT_PATH'] = ''
+
+import lambda_function  # noqa: E402
+from token_checks import TokenRejected  # noqa: E402
+
+METHOD_ARN = 'arn:aws:execute-api:us-east-1:123456789012:abcdef1234/prod/$connect'
+
+
+def event(token):
+    return {'queryStringParameters': {'Authorization': token}, 'methodArn': METHOD_ARN}
+
+
+class TestNegativeCache(unittest.TestCase):
+    def setUp(self):
+        lambda_function.DECISIONS.clear()
+        lambda_function.REJECTED.clear()
+        self.addCleanup(lambda_function.REJECTED.clear)
+        self.now = 1000000.0
+        patch = mock.patch('lambda_function.time.time', lambda: self.now)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def reject(self, reason):
+        verify = mock.Mock(side_effect=TokenRejected(reason))
+        patch = mock.patch('lambda_function.verify_token', verify)
+        patch.start()
+        self.addCleanup(patch.stop)
+        return verify
+
+    def test_rejected_token_is_not_verified_again(self):
+        verify = self.reject('bad_signature')
+
+        self.assertIsNone(lambda_function.lambda_handler(event('a.b.c'), None))
+        self.assertIsNone(lambda_function.lambda_handler(event('a.b.c'), None))
+        self.assertEqual(verify.call_count, 1)
+
+        # A different token is still verified
+        lambda_function.lambda_handler(event('a.b.d'), None)
+        self.assertEqual(verify.call_count, 2)
+
+    def test_rejection_expires(self):
+        verify = self.reject('expired')
+        lambda_function.lambda_handler(event('a.b.c'), None)
+
+        self.now += lambda_function.NEGATIVE_CACHE_TTL - 1
+        lambda_function.lambda_handler(event('a.b.c'), None)
+        self.assertEqual(verify.call_count, 1)
+
+        self.now += 1
+        lambda_function.lambda_handler(event('a.b.c'), None)
+        self.assertEqual(verify.call_count, 2)
+
+    def test_cached_rejection_keeps_its_reason(self):
+        self.reject('wrong_audience')
+        lambda_function.lambda_handler(event('a.b.c'), None)
+        before = lambda_function.REJECTIONS['wrong_audience']
+
+        lambda_function.lambda_handler(event('a.b.c'), None)
+        self.assertEqual(lambda_function.REJECTIONS['wrong_audience'], before + 1)
+
+    def test_only_costly_failures_are_remembered(self):
+        # unknown_kid can clear up by itself once the key set is refreshed
+        verify = self.reject('unknown_kid')
+
+        lambda_function.lambda_handler(event('a.b.c'), None)
+        lambda_function.lambda_handler(event('a.b.c'), None)
+        self.assertEqual(verify.call_count, 2)
+        self.assertEqual(len(lambda_function.REJECTED), 0)
+
+    def test_shape_failures_are_not_cached(self):
+        verify = self.reject('bad_signature')
+
+        self.assertIsNone(lambda_function.lambda_handler(event('not a token'), None))
+        self.assertEqual(verify.call_count, 0)
+        self.assertEqual(len(lambda_function.REJECTED), 0)
+
+
+class TestPolicyResource(unittest.TestCase):
+    def test_scopes(self):
+        api = 'arn:aws:execute-api:us-east-1:123456789012:abcdef1234'
+        self.assertEqual(lambda_function.policy_resource(METHOD_ARN, 'method'), METHOD_ARN)
+        self.assertEqual(lambda_function.policy_resource(METHOD_ARN, 'stage'), f'{api}/prod/*')
+        self.assertEqual(lambda_function.policy_resource(METHOD_ARN, 'api'), f'{api}/*')
+
+    def test_arn_without_path_is_kept(self):
+        arn = 'arn:aws:execute-api:us-east-1:123456789012:abcdef1234'
+        for scope in lambda_function.POLICY_RESOURCE_SCOPES:
+            self.assertEqual(lambda_function.policy_resource(arn, scope), arn)
+
+    def test_deny_only_covers_the_requested_route(self):
+        with mock.patch('lambda_function.policy_resource', wraps=lambda_function.policy_resource) as resource:
+            policy = lambda_function.build_policy('user-1', '', METHOD_ARN, effect='Deny')
+
+        self.assertEqual(policy['policyDocument']['Statement'][0]['Resource'], METHOD_ARN)
+        resource.assert_not_called()
+
+    def test_unknown_scope_fails_at_import(self):
+        spec = importlib.util.spec_from_file_location('lambda_function_scope', lambda_function.__file__)
+        with mock.patch.dict(os.environ, {'POLICY_RESOURCE_SCOPE': 'stages'}):
+            with self.assertRaises(ValueError) as cm:
+                spec.loader.exec_module(importlib.util.module_from_spec(spec))
+        self.assertIn("'stages'", str(cm.exception))
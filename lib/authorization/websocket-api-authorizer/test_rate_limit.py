@@ -0,0 +1,101 @@
+import unittest
+
+from rate_limit import DynamoDBBucketStore, InMemoryBucketStore, LocalTable, RateLimiter
+
+
+class BucketBehaviour:
+    """Refill and burst checks shared by every store."""
+
+    def store(self):
+        raise NotImplementedError
+
+    def limiter(self, rate=1, burst=3):
+        return RateLimiter(rate=rate, burst=burst, store=self.store())
+
+    def test_burst_then_throttled(self):
+        limiter = self.limiter()
+
+        self.assertEqual([limiter.allow('alice', now=100) for _ in range(4)], [True, True, True, False])
+        self.assertEqual(limiter.stats(), {'enabled': True, 'allowed': 3, 'throttled': 1})
+
+    def test_refills_at_rate(self):
+        limiter = self.limiter(rate=2)
+        for _ in range(3):
+            limiter.allow('alice', now=100)
+
+        self.assertFalse(limiter.allow('alice', now=100.25))
+        self.assertTrue(limiter.allow('alice', now=100.5))
+        self.assertFalse(limiter.allow('alice', now=100.5))
+
+    def test_refill_is_capped_at_burst(self):
+        limiter = self.limiter()
+        limiter.allow('alice', now=100)
+
+        results = [limiter.allow('alice', now=1000) for _ in range(4)]
+        self.assertEqual(results, [True, True, True, False])
+
+    def test_principals_have_separate_buckets(self):
+        limiter = self.limiter(burst=1)
+
+        self.assertTrue(limiter.allow('alice', now=100))
+        self.assertFalse(limiter.allow('alice', now=100))
+        self.assertTrue(limiter.allow('bob', now=100))
+
+    def test_zero_rate_disables_limiter(self):
+        limiter = self.limiter(rate=0)
+
+        self.assertTrue(all(limiter.allow('alice', now=100) for _ in range(10)))
+        self.assertFalse(limiter.stats()['enabled'])
+
+
+class TestInMemoryBucketStore(BucketBehaviour, unittest.TestCase):
+    def store(self):
+        return InMemoryBucketStore()
+
+    def test_least_recently_seen_bucket_is_dropped(self):
+        limiter = RateLimiter(rate=1, burst=1, store=InMemoryBucketStore(max_principals=2))
+        limiter.allow('alice', now=100)
+        limiter.allow('bob', now=100)
+        limiter.allow('carol', now=100)
+
+        # alice's empty bucket was evicted, so she starts from a full one
+        self.assertTrue(limiter.allow('alice', now=100))
+        self.assertFalse(limiter.allow('carol', now=100))
+
+
+class TestDynamoDBBucketStore(BucketBehaviour, unittest.TestCase):
+    def store(self):
+        self.table = LocalTable()
+        return DynamoDBBucketStore(None, table=self.table)
+
+    def test_bucket_is_shared_between_environments(self):
+        table = LocalTable()
+        first = RateLimiter(rate=1, burst=2, store=DynamoDBBucketStore(None, table=table))
+        second = RateLimiter(rate=1, burst=2, store=DynamoDBBucketStore(None, table=table))
+
+        self.assertTrue(first.allow('alice', now=100))
+        self.assertTrue(second.allow('alice', now=100))
+        self.assertFalse(first.allow('alice', now=100))
+
+    def test_retries_after_concurrent_update(self):
+        store = self.store()
+        put_item = self.table.put_item
+
+        def racing_put_item(**kwargs):
+            # Another environment takes a token between our read and write
+            self.table.put_item = put_item
+            DynamoDBBucketStore(None, table=self.table).take('alice', 1, 2, 100)
+            return put_item(**kwargs)
+
+        self.table.put_item = racing_put_item
+        self.assertTrue(store.take('alice', 1, 2, 100))
+        self.assertFalse(store.take('alice', 1, 2, 100))
+
+    def test_unavailable_table_allows(self):
+        store = self.store()
+
+        def fail(**kwargs):
+            raise OSError('unreachable')
+
+        self.table.get_item = fail
+        self.assertTrue(store.take('alice', 1, 1, 100))
@@ -0,0 +1,60 @@
+import unittest
+
+from token_cache import TokenCache, token_hash
+
+
+class TestTokenCache(unittest.TestCase):
+    def test_hit_until_expiry(self):
+        cache = TokenCache()
+        cache.put(b'a', 'allow', expires_at=110, now=100)
+
+        self.assertEqual(cache.get(b'a', now=109.9), 'allow')
+        self.assertIsNone(cache.get(b'a', now=110))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_already_expired_value_is_not_stored(self):
+        cache = TokenCache()
+        cache.put(b'a', 'allow', expires_at=100, now=100)
+
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TokenCache(max_entries=2)
+        cache.put(b'a', 1, expires_at=200, now=100)
+        cache.put(b'b', 2, expires_at=200, now=100)
+        cache.get(b'a', now=100)
+        cache.put(b'c', 3, expires_at=200, now=100)
+
+        self.assertEqual(cache.get(b'a', now=100), 1)
+        self.assertIsNone(cache.get(b'b', now=100))
+        self.assertEqual(cache.get(b'c', now=100), 3)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_put_replaces_value_and_expiry(self):
+        cache = TokenCache()
+        cache.put(b'a', 1, expires_at=200, now=100)
+        cache.put(b'a', 2, expires_at=150, now=100)
+
+        self.assertEqual(cache.get(b'a', now=149), 2)
+        self.assertIsNone(cache.get(b'a', now=150))
+
+    def test_disabled(self):
+        for cache in (TokenCache(enabled=False), TokenCache(max_entries=0)):
+            cache.put(b'a', 1, expires_at=200, now=100)
+            self.assertIsNone(cache.get(b'a', now=100))
+            self.assertFalse(cache.stats()['enabled'])
+
+    def test_clear(self):
+        cache = TokenCache()
+        cache.put(b'a', 1, expires_at=200, now=100)
+        cache.clear()
+
+        self.assertIsNone(cache.get(b'a', now=100))
+
+
+class TestTokenHash(unittest.TestCase):
+    def test_str_and_bytes_hash_alike(self):
+        self.assertEqual(token_hash('abc'), token_hash(b'abc'))
+        self.assertNotEqual(token_hash('abc'), token_hash('abd'))
+        self.assertEqual(len(token_hash('x' * 10000)), 32)
@@ -0,0 +1,80 @@
+import base64
+import json
+import unittest
+
+from token_checks import TokenRejected, check_shape, decode
+
+ISSUER = 'https://cognito-idp.us-east-1.amazonaws.com/pool'
+ALLOWED = frozenset(['RS256'])
+
+
+def segment(value):
+    if not isinstance(value, bytes):
+        value = json.dumps(value).encode()
+    return base64.urlsafe_b64encode(value).rstrip(b'=').decode()
+
+
+def token(header=None, claims=None):
+    header = {'alg': 'RS256', 'kid': 'k1'} if header is None else header
+    claims = {'iss': ISSUER, 'sub': 'user-1'} if claims is None else claims
+    return '.'.join([segment(header), segment(claims), segment(b'signature')])
+
+
+class TestCheckShape(unittest.TestCase):
+    def assertRejected(self, reason, value, max_bytes=1024):
+        with self.assertRaises(TokenRejected) as cm:
+            check_shape(value, max_bytes)
+        self.assertEqual(cm.exception.reason, reason)
+
+    def test_well_formed_token_passes(self):
+        check_shape(token(), 1024)
+
+    def test_missing(self):
+        for value in (None, '', b'a.b.c', 42):
+            self.assertRejected('missing', value)
+
+    def test_oversized(self):
+        value = token()
+        self.assertRejected('oversized', value, max_bytes=len(value) - 1)
+        check_shape(value, len(value))
+
+    def test_malformed(self):
+        for value in ('a.b', 'a.b.c.d', 'a..c', 'a.b.c ', 'a.b+/.c', 'a.b.c\n'):
+            self.assertRejected('malformed', value)
+
+
+class TestDecode(unittest.TestCase):
+    def assertRejected(self, reason, value, issuer=ISSUER):
+        with self.assertRaises(TokenRejected) as cm:
+            decode(value, ALLOWED, issuer)
+        self.assertEqual(cm.exception.reason, reason)
+
+    def test_returns_parsed_token(self):
+        parsed = decode(token(), ALLOWED, ISSUER)
+
+        self.assertEqual(parsed.header['kid'], 'k1')
+        self.assertEqual(parsed.claims['sub'], 'user-1')
+
+    def test_bad_header(self):
+        self.assertRejected('bad_header', '.'.join([segment(b'not json'), segment({}), segment(b's')]))
+        self.assertRejected('bad_header', token(header=['RS256']))
+
+    def test_alg_not_allowed(self):
+        for alg in ('HS256', 'none', None, ['RS256'], {'RS256': 1}):
+            self.assertRejected('alg_not_allowed', token(header={'alg': alg, 'kid': 'k1'}))
+        self.assertRejected('alg_not_allowed', token(header={'kid': 'k1'}))
+
+    def test_missing_kid(self):
+        self.assertRejected('missing_kid', token(header={'alg': 'RS256'}))
+        self.assertRejected('missing_kid', token(header={'alg': 'RS256', 'kid': ['k1']}))
+
+    def test_bad_claims(self):
+        self.assertRejected('bad_claims', '.'.join([segment({'alg': 'RS256', 'kid': 'k1'}), segment(b'{'), segment(b's')]))
+        self.assertRejected('bad_claims', token(claims=['sub']))
+
+    def test_wrong_issuer(self):
+        self.assertRejected('wrong_issuer', token(claims={'iss': 'https://example.com', 'sub': 'user-1'}))
+        self.assertRejected('wrong_issuer', token(claims={'sub': 'user-1'}))
+
+    def test_issuer_not_checked_without_one(self):
+        decode(token(claims={'sub': 'user-1'}), ALLOWED, None)
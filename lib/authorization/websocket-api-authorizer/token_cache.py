@@ -0,0 +1,80 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+def token_hash(token):
+    """Fixed-size cache key for a token, so raw tokens are never held as keys."""
+    if isinstance(token, str):
+        token = token.encode('utf-8')
+    return hashlib.sha256(token).digest()
+
+
+class TokenCache:
+    """Bounded LRU keyed by token hash where every entry has its own expiry.
+
+    Used by the authorizer to remember the outcome of verifying a token until
+    the token itself expires, so reconnects with the same token skip the
+    signature and claims checks.
+    """
+
+    def __init__(self, max_entries=2048, enabled=True):
+        self.max_entries = max_entries
+        self.enabled = enabled and max_entries > 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, now=None):
+        if not self.enabled:
+            return None
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if now >= expires_at:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, expires_at, now=None):
+        if not self.enabled:
+            return
+        now = time.time() if now is None else now
+        if expires_at <= now:
+            return
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'evictions': self.evictions,
+        }
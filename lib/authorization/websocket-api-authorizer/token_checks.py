@@ -0,0 +1,56 @@
+import re
+
+from jose.exceptions import JWTError
+from jose.jwt import ParsedJWT
+
+# Three non-empty base64url segments, nothing else. The size limit is checked
+# first, so matching this is bounded by MAX_TOKEN_BYTES.
+TOKEN_SHAPE = re.compile(r'[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+')
+
+
+class TokenRejected(Exception):
+    """A token was refused before or during verification; `reason` is a short metric-friendly tag."""
+
+    def __init__(self, reason, detail=None):
+        super().__init__(detail or reason)
+        self.reason = reason
+
+
+def check_shape(token, max_bytes):
+    """Size and structure checks that cost the same whatever the token contains."""
+    if not token or not isinstance(token, str):
+        raise TokenRejected('missing', 'No token supplied')
+    if len(token) > max_bytes:
+        raise TokenRejected('oversized', f'Token is longer than {max_bytes} bytes')
+    if not TOKEN_SHAPE.fullmatch(token):
+        raise TokenRejected('malformed', 'Token is not three base64url segments')
+
+
+def decode(token, allowed_algs, issuer):
+    """Decode header and claims of a token that passed check_shape, without any crypto.
+
+    Returns the ParsedJWT, whose signing input and signature are then used
+    for verification without splitting or decoding the token again.
+    """
+    try:
+        parsed = ParsedJWT(token)
+    except JWTError as e:
+        raise TokenRejected('bad_header', f'Undecodable token header: {str(e)}')
+
+    header = parsed.header
+    alg = header.get('alg')
+    # Checked to be a string first: a list or object would make the set
+    # membership test raise TypeError instead of rejecting the token
+    if not isinstance(alg, str) or alg not in allowed_algs:
+        raise TokenRejected('alg_not_allowed', f'Algorithm {alg!r} is not allowed')
+    if not isinstance(header.get('kid'), str):
+        raise TokenRejected('missing_kid', 'Token header has no kid')
+
+    try:
+        claims = parsed.claims
+    except JWTError as e:
+        raise TokenRejected('bad_claims', f'Undecodable token claims: {str(e)}')
+    if issuer is not None and claims.get('iss') != issuer:
+        raise TokenRejected('wrong_issuer', 'Token was not issued by this user pool')
+
+    return parsed